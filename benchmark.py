@@ -0,0 +1,274 @@
+import argparse
+import json
+import logging
+import os
+import pickle
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit import logger as st_logger
+
+# The loaders are Streamlit-cached; running them bare logs a warning per call
+st_logger.set_log_level(logging.ERROR)
+
+import data
+from facet_index import FacetIndex
+from forecasting import (
+    MASTER_FILE, SimulationCache, add_reliability_demand, cached_daywise_forecast, cached_inventory_chart, clear_memo, load_columnar,
+    make_daywise_forecast, plan_reorders, read_master_csv, reliability_demand, source_fingerprint,
+)
+from forecasting.cache import CACHE_DIR
+from search_index import SearchIndex
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.path.join(APP_DIR, "files")
+# Per-material sources and their key column; synthetic copies get fresh material numbers
+# (the original key plus a copy suffix; real exports have non-numeric keys such as 0C9950000)
+MATERIAL_FILES = {
+    'forecasted.csv': 'Material No',
+    'leadtime.csv': 'Material No',
+    'reliability.csv': 'Material No',
+    'store_items_master_file_truncated.csv': 'Material',
+}
+STOCK_FILE = 'stock_value_2024.csv'
+SEARCH_QUERIES = ['valve', 'drill pipe', '1000000', 'ring gasket 10', '3-1/2']
+# Modules a fresh process imports to start the app and then open each page
+IMPORT_ROUTES = {
+    'main': ['main'],
+    'Material Search': ['main', 'material_search'],
+    'Material Details': ['main', 'material_search', 'material_details', 'plotly.graph_objects'],
+    'Dashboard': ['main', 'dashboard', 'plotly.express'],
+    'Notification': ['main', 'notification'],
+}
+
+
+# Write the files/ datasets scaled `scale` times into `target`/files
+def build_dataset(scale, target):
+    files = os.path.join(target, "files")
+    os.makedirs(files, exist_ok=True)
+    for name, key in MATERIAL_FILES.items():
+        table = pd.read_csv(os.path.join(SOURCE_DIR, name), encoding='utf-8-sig', dtype={key: str})
+        copies = [table]
+        for i in range(1, scale):
+            copy = table.copy()
+            copy[key] = copy[key] + f"_{i}"
+            copies.append(copy)
+        pd.concat(copies, ignore_index=True).to_csv(os.path.join(files, name), index=False)
+    with open(os.path.join(SOURCE_DIR, STOCK_FILE), 'rb') as f:
+        header, body = f.read().split(b'\n', 1)
+    with open(os.path.join(files, STOCK_FILE), 'wb') as f:
+        f.write(header + b'\n' + body.rstrip(b'\n') + b'\n')
+        for _ in range(scale - 1):
+            f.write(body.rstrip(b'\n') + b'\n')
+
+
+def clear_memory_caches():
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    clear_memo()
+
+
+def clear_all_caches():
+    clear_memory_caches()
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+
+# Time one call, then repeat it under tracemalloc for peak memory (Python and NumPy
+# allocations). Tracing slows allocation-heavy code, so it is kept out of the timed run.
+# `setup` restores the starting state (e.g. cleared caches) before each run.
+def measure(results, name, scale, state, rows, fn, setup=None):
+    if setup:
+        setup()
+    started = time.perf_counter()
+    fn()
+    wall = time.perf_counter() - started
+    if setup:
+        setup()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    results.append({
+        'name': name,
+        'scale': scale,
+        'state': state,
+        'rows': rows,
+        'wall_s': round(wall, 6),
+        'peak_mem_bytes': peak,
+        'rows_per_s': round(rows / wall, 1) if wall > 0 else None,
+    })
+    print(f"  {name:<28} {state:<5} {wall * 1000:>10.1f} ms  {peak / 2 ** 20:>8.1f} MiB  {rows} rows")
+
+
+# Loader timings in three states: nothing cached, Parquet on disk only, fully warm
+def bench_loaders(results, scale, material_id):
+    loaders = {
+        'load_main_data': (data.load_main_data, 'store_items_master_file_truncated.csv'),
+        'load_additional_data': (lambda: data.load_additional_data(material_id), 'forecasted.csv'),
+        'load_leadtime_data': (lambda: data.load_leadtime_data(material_id), 'leadtime.csv'),
+        'load_reliability_data': (lambda: data.load_reliability_data(material_id), 'reliability.csv'),
+        'load_stock_value': (lambda: data.load_stock_value(f"files/{STOCK_FILE}"), STOCK_FILE),
+    }
+    for name, (loader, source) in loaders.items():
+        with open(os.path.join("files", source), 'rb') as f:
+            rows = sum(1 for _ in f) - 1
+        measure(results, name, scale, 'cold', rows, loader, setup=clear_all_caches)
+        measure(results, name, scale, 'disk', rows, loader, setup=clear_memory_caches)
+        measure(results, name, scale, 'warm', rows, loader)
+
+
+def bench_forecast(results, scale):
+    forecasted = pd.read_csv("files/forecasted.csv")
+    forecasted['Material No'] = forecasted['Material No'].astype(str)
+    mat = forecasted.loc[forecasted['oem'] == 'atlas', 'Material No'].iloc[0]
+    measure(results, 'make_daywise_forecast', scale, 'warm', len(forecasted), lambda: make_daywise_forecast(forecasted, mat, 'atlas'))
+    # Keyed by the source fingerprint, as on the details page
+    cache = SimulationCache()
+    version = source_fingerprint("files/forecasted.csv")
+    measure(results, 'cached_daywise_forecast', scale, 'cold', len(forecasted), lambda: cached_daywise_forecast(forecasted, mat, 'atlas', version, cache=cache), setup=cache.clear)
+    measure(results, 'cached_daywise_forecast', scale, 'warm', len(forecasted), lambda: cached_daywise_forecast(forecasted, mat, 'atlas', version, cache=cache))
+    measure(results, 'cached_inventory_chart', scale, 'warm', len(forecasted), lambda: cached_inventory_chart(forecasted, mat, 'atlas', version, cache=cache))
+    materials = forecasted[['Material No', 'oem']].drop_duplicates().shape[0]
+    measure(results, 'plan_reorders', scale, 'warm', materials, lambda: plan_reorders(forecasted))
+
+
+# Failure demand for the whole installed base (ten units of every material with a
+# reliability row) over several horizons, and merging it into the planning inputs
+def bench_reliability(results, scale):
+    reliability = pd.read_csv("files/reliability.csv", dtype={'Material No': str})
+    forecasted = pd.read_csv("files/forecasted.csv", dtype={'Material No': str})
+    population = pd.DataFrame({'Material No': reliability['Material No'].unique(), 'Population': 10})
+    horizons = (90, 182, 365, 730, 1825)
+    measure(results, 'reliability_demand', scale, 'warm', len(population) * len(horizons), lambda: reliability_demand(reliability, population, horizons))
+    measure(results, 'add_reliability_demand', scale, 'warm', len(forecasted), lambda: add_reliability_demand(forecasted, reliability, population))
+
+
+# The search page path: index/facet build per data load, then filtering per rerun
+def bench_search(results, scale):
+    master = data.load_main_data()
+    measure(results, 'search_index_build', scale, 'cold', len(master), lambda: SearchIndex(master))
+    measure(results, 'facet_index_build', scale, 'cold', len(master), lambda: FacetIndex(master))
+    index, facets = SearchIndex(master), FacetIndex(master)
+
+    def search():
+        for query in SEARCH_QUERIES:
+            rows = facets.select({'Material Type': 'ZSTO'})
+            hits = index.search(query)
+            master.iloc[hits[np.isin(hits, rows)][:50]]
+
+    measure(results, 'search_filter', scale, 'warm', len(master) * len(SEARCH_QUERIES), search)
+
+
+# Import cost of `modules` in a fresh interpreter, from `python -X importtime`.
+# Returns the total and each top-level package's share (self time summed over its submodules).
+def import_profile(modules):
+    code = '; '.join(f'import {m}' for m in modules)
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=APP_DIR, capture_output=True, text=True)
+    packages = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        package = name.strip().split('.')[0]
+        packages[package] = packages.get(package, 0) + int(self_us)
+    return sum(packages.values()) / 1e6, {k: v / 1e6 for k, v in packages.items()}
+
+
+# Cold import time per page route, with the heaviest packages broken out
+def bench_imports(results, top=8):
+    for route, modules in IMPORT_ROUTES.items():
+        total, packages = import_profile(modules)
+        heaviest = dict(sorted(packages.items(), key=lambda p: -p[1])[:top])
+        results.append({
+            'name': f'import:{route}',
+            'scale': None,
+            'state': 'cold',
+            'rows': None,
+            'wall_s': round(total, 6),
+            'breakdown_s': {k: round(v, 6) for k, v in heaviest.items()},
+        })
+        print(f"  import {route:<21} {total * 1000:>10.1f} ms  " + ', '.join(f"{k} {v * 1000:.0f}" for k, v in heaviest.items()))
+
+
+# Master frame footprint in three layouts: Python-object strings (the old astype(str)
+# frame), the frame as read from the columnar cache, and the compact shared frame.
+# pickle_bytes is what st.cache_data would copy into every session.
+def bench_master_memory(results, scale):
+    compact = data.load_main_data()
+    layouts = {'object': compact.astype(object), 'as_read': load_columnar(MASTER_FILE, read_master_csv), 'compact': compact}
+    for state, frame in layouts.items():
+        columns = frame.memory_usage(deep=True, index=False)
+        results.append({
+            'name': 'master_memory',
+            'scale': scale,
+            'state': state,
+            'rows': len(frame),
+            'memory_bytes': int(columns.sum()),
+            'pickle_bytes': len(pickle.dumps(frame)),
+            'columns_bytes': {k: int(v) for k, v in columns.items()},
+        })
+        print(f"  master_memory {state:<8} {columns.sum() / 2 ** 20:>10.1f} MiB  pickled {len(pickle.dumps(frame)) / 2 ** 20:.1f} MiB")
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(SOURCE_DIR), capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return None
+
+
+def run(scales):
+    results = []
+    print("imports")
+    bench_imports(results)
+    for scale in scales:
+        with tempfile.TemporaryDirectory() as workdir:
+            print(f"scale {scale}x")
+            build_dataset(scale, workdir)
+            cwd = os.getcwd()
+            os.chdir(workdir)
+            try:
+                material_id = str(pd.read_csv("files/forecasted.csv", usecols=['Material No'], nrows=1)['Material No'].iloc[0])
+                bench_loaders(results, scale, material_id)
+                bench_forecast(results, scale)
+                bench_reliability(results, scale)
+                bench_search(results, scale)
+                bench_master_memory(results, scale)
+            finally:
+                clear_all_caches()
+                os.chdir(cwd)
+    return {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'results': results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the forecasting and data-loading hot paths")
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100], help="Dataset scale factors")
+    parser.add_argument('--output', default='bench_output.json')
+    args = parser.parse_args()
+
+    report = run(args.scales)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(report['results'])} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 import streamlit as st
-from data import load_stock_value
+from data import load_stock_rollups
+from forecasting import STOCK_FILE
+from forecasting.stock_value import snapshot_trend
 import pandas as pd
-import plotly.express as px
 
 def format_indian_units(number):
 
@@ -21,45 +22,44 @@ def format_indian_units(number):
 
 # Dashboard Page (unchanged from your original)
 def dashboard_page():
+    import plotly.express as px
+
     st.title("📊 Dashboard")
     
-    stock_2024, stock_2025 = load_stock_value("files/stock_value_2024.csv")
+    rollups = load_stock_rollups(STOCK_FILE)
     
-    if stock_2024 is not None and stock_2025 is not None:
+    if rollups is not None:
+        trend = snapshot_trend(rollups)
+        trend['Amount (crore)'] = (trend['Amount'] / 10000000).round(2)
+        latest, previous = trend.iloc[-1], trend.iloc[-2]
 
         # Create two columns
         col1, col2 = st.columns(2)
 
         # First column content
         with col1:
-            st.subheader("Total Stock Value 2025")
-            st.header(f"₹ {format_indian_units(stock_2025)}")
+            st.subheader(f"Total Stock Value {latest['Snapshot']}")
+            st.header(f"₹ {format_indian_units(latest['Amount'])}")
 
         # Second column content
         with col2:
             st.subheader('Inventory Present Trend')
-            
-            # Create dataframe
-            data = {'Year': [2023, 2024, 2025],
-                    'Amount (crore)': [50, 60, 110.73]}
-            df = pd.DataFrame(data)
 
-            # Calculate percentage increase (2024 to 2025)
-            prev_amount = df.loc[df['Year'] == 2024, 'Amount (crore)'].values[0]
-            current_amount = df.loc[df['Year'] == 2025, 'Amount (crore)'].values[0]
-            percentage_increase = ((current_amount - prev_amount) / prev_amount) * 100
+            # Calculate percentage increase between the last two snapshots
+            percentage_increase = ((latest['Amount'] - previous['Amount']) / previous['Amount']) * 100
 
             # Display the trend metric
             st.metric(
-                label="",
+                label="Change",
                 value=f"{percentage_increase:.1f}% increase",
-                delta="2024 → 2025",
-                delta_color="inverse"
+                delta=f"{previous['Snapshot']} → {latest['Snapshot']}",
+                delta_color="inverse",
+                label_visibility="collapsed"
             )
 
         # Create plot
-        fig = px.line(df, x='Year', y='Amount (crore)', 
-                    title='Amount Growth Over Years',
+        fig = px.line(trend, x='Snapshot', y='Amount (crore)', 
+                    title='Amount Growth Over Snapshots',
                     markers=True,
                     text='Amount (crore)')
 
@@ -67,9 +67,24 @@ def dashboard_page():
         fig.update_traces(textposition='top center')
         fig.update_layout(
             yaxis_title='Amount (in crores)',
-            xaxis=dict(tickmode='linear', dtick=1),
             hovermode='x unified'
         )
 
         # Display plot in Streamlit
-        st.plotly_chart(fig)
\ No newline at end of file
+        st.plotly_chart(fig)
+
+        st.divider()
+
+        # Drill-down from the precomputed rollups; no re-read of the stock file
+        st.subheader("Stock Value Breakdown")
+        dimension = st.selectbox("Break down by", [d for d in rollups if d != 'Total'])
+        breakdown = (rollups[dimension] / 10000000).round(2).reset_index()
+        breakdown = breakdown.melt(id_vars=dimension, var_name='Snapshot', value_name='Amount (crore)')
+
+        fig = px.bar(breakdown, x='Amount (crore)', y=dimension, color='Snapshot',
+                     barmode='group', orientation='h',
+                     title=f'Stock Value by {dimension}')
+        fig.update_layout(yaxis={'categoryorder': 'total ascending'}, height=max(400, 30 * rollups[dimension].shape[0]))
+        st.plotly_chart(fig)
+
+        st.dataframe(rollups[dimension].map(format_indian_units), use_container_width=True)
\ No newline at end of file
@@ -1,78 +1,120 @@
-import streamlit as st
+import os
 import pandas as pd
+import streamlit as st
+from forecasting import lookup_material as lookup_indexed, lookup_material_versioned
+from forecasting import FORECAST_FILE, LEADTIME_FILE, MASTER_FILE, POPULATION_FILE, RELIABILITY_FILE, compact_master, load_columnar, read_master_csv
+from forecasting.stock_value import stock_rollups, read_stock_csv
+from search_index import SearchIndex
+from facet_index import FacetIndex
+from stock_alerts import AlertScanner
+from profiling import cache_miss, timed
 
-# Function to load main data from CSV
-@st.cache_data
+# Function to load main data from CSV.
+# One compact copy shared by every session (cache_resource does not pickle or copy it);
+# callers must treat the frame as read-only.
+@timed("data.load_main_data")
+@st.cache_resource
+@cache_miss("data.load_main_data")
 def load_main_data():
     try:
-        data = pd.read_csv("files/spare_items_master_file_truncated.csv")
-        if 'Material No' in data.columns:
-            data['Material No'] = data['Material No'].astype(str)
-        return data
+        return compact_master(load_columnar(MASTER_FILE, read_master_csv))
     except Exception as e:
         st.error(f"Error loading main file: {e}")
         return None
     
+# Search index over the master table, built once per data load
+@timed("data.load_search_index")
+@st.cache_resource
+@cache_miss("data.load_search_index")
+def load_search_index():
+    return SearchIndex(load_main_data())
+
+# Facet options and row positions for the search filters, built once per data load
+@timed("data.load_facet_index")
+@st.cache_resource
+@cache_miss("data.load_facet_index")
+def load_facet_index():
+    return FacetIndex(load_main_data())
+
+# Catalogue-wide stock alert scanner shared by all sessions; it refreshes itself when forecasted.csv changes
+@timed("data.load_alert_scanner")
+@st.cache_resource
+@cache_miss("data.load_alert_scanner")
+def load_alert_scanner():
+    return AlertScanner()
+
+# Rows for one material as an independent frame (empty if the material is unknown).
+# The indexed table is shared by the process and rebuilt when the file changes.
+@timed("data.lookup_material")
+def lookup_material(filepath, material_id):
+    return lookup_indexed(filepath, material_id)
+
 # Function to load additional data from different CSV
-@st.cache_data
+@timed("data.load_additional_data")
 def load_additional_data(material_id):
     try:
-        additional_data = pd.read_csv("files/forecasted.csv")  # Replace with your actual filename
-        if 'Material No' in additional_data.columns:
-            additional_data['Material No'] = additional_data['Material No'].astype(str)
-        return additional_data[additional_data['Material No'] == material_id]
+        return lookup_material(FORECAST_FILE, material_id)
     except Exception as e:
         st.warning(f"Could not load additional details for material {material_id}: {e}")
         return None
     
+# Forecast rows for one material and the fingerprint of the file they came from,
+# for keying results computed from exactly these rows
+@timed("data.load_forecast_rows")
+def load_forecast_rows(material_id):
+    try:
+        return lookup_material_versioned(FORECAST_FILE, material_id)
+    except Exception as e:
+        st.warning(f"Could not load additional details for material {material_id}: {e}")
+        return None, None
+    
 # Function to load leadtime from different CSV
-@st.cache_data
+@timed("data.load_leadtime_data")
 def load_leadtime_data(material_id):
     try:
-        leadtime_data = pd.read_csv("files/leadtime.csv")  # Replace with your actual filename
-        if 'Material No' in leadtime_data.columns:
-            leadtime_data['Material No'] = leadtime_data['Material No'].astype(str)
-        return leadtime_data[leadtime_data['Material No'] == material_id]
+        return lookup_material(LEADTIME_FILE, material_id)
     except Exception as e:
         st.warning(f"Could not load leadtime details for material {material_id}: {e}")
         return None
     
-# Function to load stock data from CSV
+# Function to load stock value rollups (by Plant, Material type, Material Group, MRP Controller) from CSV
+@timed("data.load_stock_rollups")
 @st.cache_data
-def load_stock_value(filepath):
+@cache_miss("data.load_stock_rollups")
+def load_stock_rollups(filepath):
     try:
-        # Try reading the CSV with different encodings if needed
-        df = pd.read_csv(filepath, encoding='latin1')  # or 'utf-8', 'cp1252'
-        
-        # Convert to numeric (handling commas, currency symbols, etc.)
-        df['ValStckVal'] = pd.to_numeric(
-            df['ValStckVal'].astype(str).str.replace('[^\d.]', '', regex=True), 
-            errors='coerce'
-        )
-        
-        df['Val.Stock in May 2025'] = pd.to_numeric(
-            df['Val.Stock in May 2025'].astype(str).str.replace('[^\d.]', '', regex=True),
-            errors='coerce'
-        )
-        
-        # Sum columns, ignoring NaN values
-        sum_2024 = df['ValStckVal'].sum(skipna=True)
-        sum_2025 = df['Val.Stock in May 2025'].sum(skipna=True)
-        
-        return sum_2024, sum_2025
-        
+        # Currency columns come back already parsed to float
+        return stock_rollups(load_columnar(filepath, read_stock_csv))
     except Exception as e:
         st.error(f"Error loading {filepath}: {str(e)}")
+        return None
+
+# Function to load stock data from CSV
+@timed("data.load_stock_value")
+def load_stock_value(filepath):
+    rollups = load_stock_rollups(filepath)
+    if rollups is None:
         return None, None
+    totals = rollups['Total'].iloc[0]
+    return totals['Mar 2024'], totals['May 2025']
     
 # Function to load reliability factor from different CSV
-@st.cache_data
+@timed("data.load_reliability_data")
 def load_reliability_data(material_id):
     try:
-        reliability_data = pd.read_csv("files/reliability.csv")  # Replace with your actual filename
-        if 'Material No' in reliability_data.columns:
-            reliability_data['Material No'] = reliability_data['Material No'].astype(str)
-        return reliability_data[reliability_data['Material No'] == material_id]
+        return lookup_material(RELIABILITY_FILE, material_id)
     except Exception as e:
-        st.warning(f"Could not load leadtime details for material {material_id}: {e}")
-        return None
\ No newline at end of file
+        st.warning(f"Could not load reliability details for material {material_id}: {e}")
+        return None
+
+# Installed quantity of a material from the optional population file (0 when absent)
+@timed("data.load_population_quantity")
+def load_population_quantity(material_id):
+    if not os.path.exists(POPULATION_FILE):
+        return 0.0
+    try:
+        rows = lookup_material(POPULATION_FILE, material_id)
+        return float(pd.to_numeric(rows['Population'], errors='coerce').sum())
+    except Exception as e:
+        st.warning(f"Could not load population for material {material_id}: {e}")
+        return 0.0
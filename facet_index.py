@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+FACET_COLUMNS = ['Manufacturer Name', 'Plant Code', 'Material Type']
+
+
+# Option lists and row positions for each categorical filter, built once per data load.
+# Combining filters is an intersection of sorted position arrays instead of a full-frame mask per filter.
+class FacetIndex:
+    def __init__(self, data, columns=FACET_COLUMNS):
+        self.size = len(data)
+        self.positions = {}
+        for col in columns:
+            if col not in data.columns:
+                continue
+            values = pd.Series(data[col].to_numpy(), index=np.arange(self.size))
+            self.positions[col] = {value: rows for value, rows in sorted(values.groupby(values, sort=False).indices.items())}
+
+    @property
+    def columns(self):
+        return list(self.positions)
+
+    def options(self, col):
+        return list(self.positions[col])
+
+    def count(self, col, value):
+        return len(self.positions[col][value])
+
+    # format_func for a selectbox: "value (rows)"
+    def label(self, col, all_label='All'):
+        return lambda value: value if value == all_label else f"{value} ({self.count(col, value)})"
+
+    # Sorted row positions matching every selected value, or None when nothing is filtered
+    def select(self, selections, all_label='All'):
+        rows = None
+        for col, value in selections.items():
+            if value is None or value == all_label or col not in self.positions:
+                continue
+            matched = self.positions[col].get(value, np.empty(0, dtype=np.intp))
+            rows = matched if rows is None else np.intersect1d(rows, matched, assume_unique=True)
+        return rows
@@ -0,0 +1,90 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from forecasting import FORECAST_DAYS, FORECAST_FILE, PLAN_COLUMNS, load_forecast, simulate_daywise
+
+GROUP_KEYS = ['Material No', 'oem']
+SIMULATION_COLUMNS = GROUP_KEYS + ['Desc', 'leadtime', 'year', 'cons_wip', 'cons_woip', 'buffer_stock']
+
+
+# Run the scalar simulation for every (Material No, oem) group in one slice of the yearly table
+def _run_chunk(chunk_id, rows, start_date, end_date):
+    started = time.perf_counter()
+    plans, errors = [], []
+    for (mat, oem), df in rows.groupby(GROUP_KEYS, sort=False, dropna=False):
+        try:
+            _, plan = simulate_daywise(df, mat, start_date, end_date)
+        except Exception as e:
+            errors.append((mat, oem, str(e)))
+            continue
+        plans.append({'Material No': mat, 'oem': oem, 'Desc': df['Desc'].iloc[0], **plan})
+    plan = pd.DataFrame(plans, columns=PLAN_COLUMNS)
+    return chunk_id, plan, errors, time.perf_counter() - started
+
+
+# Split the yearly table into chunks of whole material groups; each chunk carries only its own rows
+def split_chunks(df_yearly, chunk_size=50):
+    groups = list(df_yearly.groupby(GROUP_KEYS, sort=False, dropna=False).indices.values())
+    rows = df_yearly[SIMULATION_COLUMNS]
+    for start in range(0, len(groups), chunk_size):
+        yield rows.iloc[np.concatenate(groups[start:start + chunk_size])]
+
+
+# Print one line per finished chunk
+def print_progress(done, total, chunk_id, materials, seconds):
+    print(f"[{done}/{total}] chunk {chunk_id}: {materials} materials in {seconds:.2f}s")
+
+
+# Simulate every material on a process pool and append each chunk's plan to `output` as it finishes
+def run_parallel(df_yearly, output=None, workers=None, chunk_size=50, start_date=None, end_date=None, on_chunk=print_progress):
+    start_date = start_date or date.today()
+    end_date = end_date or start_date + timedelta(days=FORECAST_DAYS)
+    chunks = list(split_chunks(df_yearly, chunk_size))
+    if output:
+        pd.DataFrame(columns=PLAN_COLUMNS).to_csv(output, index=False)
+
+    plans, errors, timings = [], [], {}
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [pool.submit(_run_chunk, i, rows, start_date, end_date) for i, rows in enumerate(chunks)]
+        for done, future in enumerate(as_completed(futures), start=1):
+            chunk_id, plan, chunk_errors, seconds = future.result()
+            if output:
+                plan.to_csv(output, mode='a', header=False, index=False)
+            plans.append(plan)
+            errors.extend(chunk_errors)
+            timings[chunk_id] = seconds
+            if on_chunk:
+                on_chunk(done, len(chunks), chunk_id, len(plan) + len(chunk_errors), seconds)
+
+    plan = pd.concat(plans, ignore_index=True) if plans else pd.DataFrame(columns=PLAN_COLUMNS)
+    return plan, errors, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel day-wise reorder planning for every material")
+    parser.add_argument('--input', default=FORECAST_FILE)
+    parser.add_argument('--output', default='reorder_plan.csv')
+    parser.add_argument('--oem', help="Only plan materials for this oem")
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--chunk-size', type=int, default=50)
+    args = parser.parse_args()
+
+    forecasted = load_forecast(args.input)
+    if args.oem:
+        forecasted = forecasted[forecasted['oem'] == args.oem]
+
+    started = time.perf_counter()
+    plan, errors, _ = run_parallel(forecasted, args.output, args.workers, args.chunk_size)
+    print(f"Planned {len(plan)} materials in {time.perf_counter() - started:.2f}s -> {args.output}")
+    for mat, oem, error in errors:
+        print(f"Skipped {mat} ({oem}): {error}")
+
+
+if __name__ == "__main__":
+    main()
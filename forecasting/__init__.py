@@ -0,0 +1,16 @@
+# Headless forecasting: loaders, day-wise simulation and reorder planning without Streamlit
+from .cache import clear_memo, load_columnar, memoize, memoize_versioned, read_master_csv, read_material_csv, source_fingerprint
+from .engine import DAYWISE_COLUMNS, FORECAST_DAYS, make_daywise_forecast, simulate_daywise
+from .loaders import (
+    FORECAST_FILE, LEADTIME_FILE, MASTER_FILE, POPULATION_FILE, RELIABILITY_FILE, STOCK_FILE,
+    compact_master, load_forecast, load_master, load_population, load_reliability, load_stock, lookup_material,
+    lookup_material_versioned, plant_materials, read_indexed, select_material,
+)
+from .planner import PLAN_COLUMNS, plan_reorders
+from .plan_store import input_hashes, replan
+from .scenarios import SCENARIO_COLUMNS, sweep_scenarios
+from .charts import inventory_traces, lttb
+from .sim_cache import SimulationCache, cached_daywise_forecast, cached_inventory_chart, simulation_cache
+from .reliability import (
+    DEMAND_COLUMNS, add_reliability_demand, read_population_csv, reliability_at, reliability_demand, yearly_failure_demand,
+)
@@ -0,0 +1,148 @@
+import hashlib
+import json
+import os
+import threading
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+CACHE_DIR = os.path.join("files", ".cache")
+# Bump when a reader's output changes so existing cache files are rebuilt
+CACHE_VERSION = 3
+# Rows per chunk for the streaming readers; bounds ingest memory independent of file size
+CHUNK_ROWS = 100_000
+# Master columns kept on ingest, covering the store export and the material.csv layout.
+# Explicit dtypes keep every chunk on the same Parquet schema.
+MASTER_DTYPES = {
+    'Material': 'str', 'Int. Material No.': 'str', 'Material Type': 'str', 'Description': 'str',
+    'Base UOM': 'str', 'Mfr Part No': 'str', 'Manufacturer': 'str', 'Manufacturer Name': 'str',
+    'Material Group': 'Int64', 'Model Number': 'str', 'Plant Code': 'str',
+}
+
+
+# Readers yield the cleaned table in chunks; load_columnar streams them into Parquet.
+
+# Per-material tables (forecasted, leadtime, reliability) are small and read whole
+def read_material_csv(path):
+    table = pd.read_csv(path)
+    if 'Material No' in table.columns:
+        table['Material No'] = table['Material No'].astype('string')
+    yield table
+
+
+# Material master; the store export calls the key column "Material"
+def read_master_csv(path, chunksize=CHUNK_ROWS):
+    chunks = pd.read_csv(path, encoding='utf-8-sig', usecols=lambda c: c in MASTER_DTYPES, dtype=MASTER_DTYPES, chunksize=chunksize)
+    for master in chunks:
+        master = master.rename(columns={'Material': 'Material No'})
+        if 'Material No' in master.columns:
+            master['Material No'] = master['Material No'].astype('string')
+        yield master
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _cache_paths(source, reader):
+    name = f"{os.path.basename(source)}.{reader.__name__}"
+    return os.path.join(CACHE_DIR, f"{name}.parquet"), os.path.join(CACHE_DIR, f"{name}.json")
+
+
+# Load `source` through `reader`, keeping a typed Parquet copy next to the data.
+# The copy is reused while the source mtime/size match; if only the mtime moved,
+# a content hash decides whether the Parquet file is still valid.
+def load_columnar(source, reader=read_material_csv):
+    parquet_path, meta_path = _cache_paths(source, reader)
+    stat = os.stat(source)
+    fingerprint = {'version': CACHE_VERSION, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+    meta = None
+    if os.path.exists(parquet_path) and os.path.exists(meta_path):
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if all(meta.get(k) == v for k, v in fingerprint.items()):
+            return pd.read_parquet(parquet_path)
+
+    fingerprint['sha256'] = _file_hash(source)
+    if meta is not None and meta.get('version') == CACHE_VERSION and meta.get('sha256') == fingerprint['sha256']:
+        _write_meta(meta_path, fingerprint)
+        return pd.read_parquet(parquet_path)
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = f"{parquet_path}.{os.getpid()}.tmp"
+    first, count = _write_parquet(reader(source), tmp_path)
+    os.replace(tmp_path, parquet_path)
+    _write_meta(meta_path, fingerprint)
+    # A single-chunk table is still in memory; larger ones are read back from the columnar copy
+    return first if count == 1 else pd.read_parquet(parquet_path)
+
+
+# Append each chunk to one Parquet file as its own row group. Only the first chunk is
+# kept; the rest are dropped once written, so memory stays at about one chunk.
+def _write_parquet(chunks, path):
+    writer, first, count = None, None, 0
+    try:
+        for chunk in chunks:
+            if writer is None:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                writer = pq.ParquetWriter(path, table.schema)
+                first = chunk
+            else:
+                table = pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False)
+            writer.write_table(table)
+            count += 1
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        raise ValueError(f"{path}: reader produced no rows")
+    return first, count
+
+
+def _write_meta(meta_path, fingerprint):
+    tmp_path = f"{meta_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(fingerprint, f)
+    os.replace(tmp_path, meta_path)
+
+
+_memo = {}
+_memo_lock = threading.Lock()
+
+
+# Cheap change marker for a source file: (mtime, size)
+def source_fingerprint(source):
+    stat = os.stat(source)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+# In-process layer over the Parquet cache: `build(source)` runs once per source
+# fingerprint and its result is shared by every caller in the process.
+def memoize(source, build):
+    return memoize_versioned(source, build)[0]
+
+
+# memoize() plus the fingerprint of the source the returned value was built from,
+# for keying caches derived from it
+def memoize_versioned(source, build):
+    key = (os.path.abspath(source), build.__module__, build.__qualname__)
+    fingerprint = source_fingerprint(source)
+    with _memo_lock:
+        entry = _memo.get(key)
+    if entry is not None and entry[0] == fingerprint:
+        return entry[1], entry[0]
+    value = build(source)
+    with _memo_lock:
+        _memo[key] = (fingerprint, value)
+    return value, fingerprint
+
+
+def clear_memo():
+    with _memo_lock:
+        _memo.clear()
@@ -0,0 +1,70 @@
+from datetime import timedelta
+
+import numpy as np
+
+# Points per trace sent to the browser; the series are piecewise linear, so this is visually lossless
+MAX_CHART_POINTS = 400
+# Besides the breakpoints, keep one point a week so hovering still reads exact values
+HOVER_STEP_DAYS = 7
+
+
+# Largest-Triangle-Three-Buckets: indices of `threshold` points that keep the visual shape of (x, y).
+# The first and last points are always kept; each bucket in between contributes the point that
+# forms the largest triangle with the previously kept point and the next bucket's average.
+def lttb(x, y, threshold=MAX_CHART_POINTS):
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x, next_y = x[end:edges[i + 2]].mean(), y[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[n - 1], y[n - 1]
+        area = np.abs((x[a] - next_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (next_y - y[a]))
+        a = start + int(area.argmax()) if end > start else start
+        selected[i + 1] = a
+    return np.unique(selected)
+
+
+# Indices of the points where the slope of (x, y) changes, plus both ends. Dropping the
+# interior points of straight segments loses nothing when the chart joins points with lines.
+def breakpoints(x, y):
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if len(y) < 3:
+        return np.arange(len(y))
+    slopes = np.diff(y) / np.diff(x)
+    bends = ~np.isclose(slopes[1:], slopes[:-1], rtol=1e-9, atol=1e-9)
+    return np.concatenate(([0], np.flatnonzero(bends) + 1, [len(y) - 1]))
+
+
+# Inventory Level chart series for one simulation result, reduced to their breakpoints plus
+# a weekly hover grid and, if still longer than max_points, downsampled with LTTB:
+# {trace name: (dates as datetime64[D], values)}. Present stock is drawn up to the
+# delivery date, stock after replenishment from it onwards.
+def inventory_traces(daywise, plan, max_points=MAX_CHART_POINTS):
+    start = daywise['date'].iloc[0]
+    dates = np.arange(np.datetime64(start, 'D'), np.datetime64(start, 'D') + len(daywise))
+    delivery = (plan['reorder_point'] + timedelta(days=int(plan['leadtime'])) - start).days
+    delivery = min(max(delivery, 0), len(daywise))
+    series = {
+        'Buffer Stock': (slice(None), 'buffer_stock'),
+        'Present Stock': (slice(None, delivery), 'present_stock'),
+        'Stock After Replenishment': (slice(delivery, None), 'stock_after'),
+    }
+    traces = {}
+    for name, (rows, column) in series.items():
+        x = dates[rows]
+        y = daywise[column].to_numpy()[rows]
+        days = np.arange(len(y))
+        keep = np.union1d(breakpoints(days, y), days[::HOVER_STEP_DAYS])
+        keep = keep[lttb(days[keep], y[keep], max_points)]
+        traces[name] = (x[keep], y[keep])
+    return traces
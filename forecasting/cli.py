@@ -0,0 +1,78 @@
+import argparse
+import sys
+from datetime import date
+
+from .cache import load_columnar, read_material_csv
+from .loaders import (
+    FORECAST_FILE, LEADTIME_FILE, RELIABILITY_FILE, STOCK_FILE, load_forecast, load_population, load_reliability, plant_materials,
+)
+from .plan_store import STORE_FILE, replan
+from .planner import plan_reorders
+from .reliability import add_reliability_demand
+
+# --oem value that selects materials with no oem recorded
+NO_OEM = "none"
+
+
+# Yearly forecast rows for the requested materials, oems and plants (no filter keeps everything)
+def select_rows(df_yearly, materials=None, oems=None, plants=None, stock_path=STOCK_FILE):
+    mask = df_yearly['Material No'].notna()
+    if materials:
+        mask &= df_yearly['Material No'].isin([str(m) for m in materials])
+    if oems:
+        named = [o for o in oems if o.lower() != NO_OEM]
+        oem_mask = df_yearly['oem'].isin(named)
+        if len(named) < len(oems):
+            oem_mask |= df_yearly['oem'].isna()
+        mask &= oem_mask
+    if plants:
+        mask &= df_yearly['Material No'].isin(plant_materials(plants, stock_path))
+    return df_yearly[mask]
+
+
+def write_plan(plan, output, fmt=None):
+    fmt = fmt or ('parquet' if output.endswith('.parquet') else 'csv')
+    if fmt == 'parquet':
+        plan.to_parquet(output, index=False)
+    else:
+        plan.to_csv(output, index=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m forecasting", description="Write reorder plans for the selected materials")
+    parser.add_argument('--material', nargs='+', dest='materials', help="Material numbers to plan")
+    parser.add_argument('--oem', nargs='+', dest='oems', help=f"OEMs to plan ('{NO_OEM}' selects materials without an oem)")
+    parser.add_argument('--plant', nargs='+', dest='plants', help="Plant codes or names from the stock value export")
+    parser.add_argument('--start', type=date.fromisoformat, help="Simulation start date (default: today)")
+    parser.add_argument('--end', type=date.fromisoformat, help="Simulation end date (default: start + 5 years)")
+    parser.add_argument('--forecast', default=FORECAST_FILE, help="Yearly forecast CSV")
+    parser.add_argument('--stock', default=STOCK_FILE, help="Stock value CSV used for --plant")
+    parser.add_argument('--population', help="Installed-base CSV (Material No, Population); adds each year's expected failures to consumption")
+    parser.add_argument('--reliability', default=RELIABILITY_FILE, help="Reliability CSV with MTBR and K Factor, used with --population")
+    parser.add_argument('--leadtime', default=LEADTIME_FILE, help="Leadtime CSV; its rows are part of each plan's input hash")
+    parser.add_argument('--store', default=STORE_FILE, help="Plan store; materials whose inputs are unchanged are not re-simulated")
+    parser.add_argument('--full', action='store_true', help="Re-simulate every selected material and leave the plan store untouched")
+    parser.add_argument('--format', choices=['csv', 'parquet'], help="Output format (default: from the file extension)")
+    parser.add_argument('--output', required=True)
+    args = parser.parse_args(argv)
+
+    rows = select_rows(load_forecast(args.forecast), args.materials, args.oems, args.plants, args.stock)
+    if rows.empty:
+        print("No forecast rows match the selection", file=sys.stderr)
+        return 1
+    if args.population:
+        rows = add_reliability_demand(rows, load_reliability(args.reliability), load_population(args.population))
+        print(f"Reliability demand added for {rows.loc[rows['reliability_demand'] > 0, 'Material No'].nunique()} materials")
+    if args.full:
+        plan = plan_reorders(rows, start_date=args.start, end_date=args.end)
+    else:
+        leadtime = load_columnar(args.leadtime, read_material_csv)
+        plan, counts = replan(rows, leadtime, start_date=args.start, end_date=args.end, store_path=args.store)
+        print(f"{counts['recomputed']} materials re-simulated, {counts['reused']} reused from {args.store}")
+    write_plan(plan, args.output, args.format)
+
+    groups = rows[['Material No', 'oem']].drop_duplicates().shape[0]
+    print(f"Wrote {len(plan)} reorder plans to {args.output}")
+    if len(plan) < groups:
+        print(f"{groups - len(plan)} materials skipped: no forecast row for the start year", file=sys.stderr)
+    return 0
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+from datetime import date, timedelta
+
+DAYWISE_COLUMNS = ['Material No', 'Desc', 'leadtime', 'date', 'daily_cons', 'anticipated_consum', 'buffer_stock', 'present_stock', 'stock_after']
+FORECAST_DAYS = 365 * 5
+
+
+# Deplete a stock level by a fixed daily rate, clamped at zero.
+# subtract.accumulate runs the same sequential float steps as the old row-by-row loop,
+# so reorder triggers land on exactly the same day.
+def _deplete(opening, rate, days):
+    steps = np.empty(days)
+    steps[0] = opening
+    steps[1:] = rate
+    return np.maximum(np.subtract.accumulate(steps), 0)
+
+
+# Yearly constants used by the simulation: the first row seeds the opening stock,
+# the row for the simulation start year drives consumption and buffer.
+def _year_constants(df, year):
+    current = df[df['year'] == year]
+    if current.empty:
+        raise ValueError(f"No forecast row for year {year}")
+    first = df.iloc[0]
+    current = current.iloc[0]
+    leadtime = df['leadtime'].iloc[0]
+    initial_stock = first['cons_wip'] * 2
+    return {
+        'desc': first['Desc'],
+        'leadtime': leadtime,
+        'opening': initial_stock if first['buffer_stock'] < initial_stock else first['buffer_stock'] * 1.2,
+        'cons_wip': current['cons_wip'],
+        'daily_cons': current['cons_wip'] / 365,
+        'anticipated_consum': current['cons_woip'] * leadtime / 365,
+        'buffer_stock': current['buffer_stock'],
+    }
+
+
+# Run the day-wise simulation for the yearly rows of a single material/oem
+def simulate_daywise(df, mat, start_date, end_date):
+    c = _year_constants(df, start_date.year)
+    days = (end_date - start_date).days
+    leadtime = c['leadtime']
+
+    daily_cons = np.full(days, c['daily_cons'], dtype=float)
+    present_stock = _deplete(c['opening'], c['daily_cons'], days)
+    stock_after = present_stock.copy()
+
+    reorder_point = end_date + timedelta(days=2)
+    reorder_qty, updated_reorder_qty = 0, 0
+    consider_pre_order = False
+
+    # Day 0 is the opening balance and never triggers a reorder
+    below = np.flatnonzero(present_stock[1:] < c['buffer_stock'])
+    if below.size:
+        idx = int(below[0]) + 1
+        reorder_point = start_date + timedelta(days=idx)
+        reorder_qty = c['cons_wip'] + c['anticipated_consum'] + c['buffer_stock'] - present_stock[idx]
+        arrival = idx + int(leadtime)
+        if leadtime > 0 and arrival < days:
+            stock_after[arrival:] = _deplete(present_stock[arrival] + reorder_qty, c['daily_cons'], days - arrival)
+        stock_check = idx + 365 + int(leadtime)
+        if stock_check < days and present_stock[stock_check] == 0:
+            consider_pre_order = True
+            updated_reorder_qty = reorder_qty - np.cumsum(daily_cons[:idx + 1])[-1]
+
+    start = np.datetime64(start_date, 'D')
+    daywiseForecast = pd.DataFrame({
+        'Material No': mat,
+        'Desc': c['desc'],
+        'leadtime': leadtime,
+        'date': np.arange(start, start + days).astype(object),
+        'daily_cons': daily_cons,
+        'anticipated_consum': np.full(days, c['anticipated_consum'], dtype=float),
+        'buffer_stock': np.full(days, c['buffer_stock'], dtype=float),
+        'present_stock': present_stock,
+        'stock_after': stock_after,
+    }, columns=DAYWISE_COLUMNS)
+    return daywiseForecast, {
+        'reorder_point': reorder_point,
+        'reorder_qty': np.ceil(reorder_qty),
+        'updated_reorder_qty': np.ceil(updated_reorder_qty),
+        'consider_pre_order': consider_pre_order,
+        'leadtime': leadtime
+    }
+
+
+# Day-wise stock forecast and reorder plan for one material/oem from the yearly forecast table
+def make_daywise_forecast(df_yearly, mat, oem, end_date=None, start_date=None):
+    start_date = start_date or date.today()
+    end_date = end_date or start_date + timedelta(days=FORECAST_DAYS)
+    df = df_yearly[(df_yearly['Material No'] == mat) & (df_yearly['oem'] == oem)]
+    if df.empty:
+        raise ValueError(f"No forecast data for material {mat} (oem {oem})")
+    return simulate_daywise(df, mat, start_date, end_date)
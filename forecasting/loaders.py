@@ -0,0 +1,95 @@
+from .cache import load_columnar, memoize, memoize_versioned, read_master_csv, read_material_csv
+from .reliability import read_population_csv
+from .stock_value import read_stock_csv
+
+MASTER_FILE = "files/store_items_master_file_truncated.csv"
+FORECAST_FILE = "files/forecasted.csv"
+LEADTIME_FILE = "files/leadtime.csv"
+RELIABILITY_FILE = "files/reliability.csv"
+STOCK_FILE = "files/stock_value_2024.csv"
+# Optional installed-base table (Material No, Population)
+POPULATION_FILE = "files/population.csv"
+# Low-cardinality master columns, held as categoricals
+MASTER_CATEGORIES = ['Material Type', 'Base UOM', 'Material Group', 'Manufacturer Name', 'Plant Code']
+
+
+def load_master(path=MASTER_FILE):
+    return memoize(path, _read_master)
+
+
+def load_forecast(path=FORECAST_FILE):
+    return memoize(path, _read_material)
+
+
+def load_stock(path=STOCK_FILE):
+    return memoize(path, _read_stock)
+
+
+def load_reliability(path=RELIABILITY_FILE):
+    return memoize(path, _read_material)
+
+
+def load_population(path=POPULATION_FILE):
+    return memoize(path, _read_population)
+
+
+def _read_master(path):
+    return compact_master(load_columnar(path, read_master_csv))
+
+
+# Compact in-memory master: categoricals for the low-cardinality columns and Arrow-backed
+# strings for the key and free text (pandas 3 reads text that way already; older pandas
+# gives Python-object columns, which are converted here)
+def compact_master(master):
+    for col in master.columns:
+        if col in MASTER_CATEGORIES:
+            master[col] = master[col].astype('category')
+        elif col == 'Material No' or master[col].dtype == object:
+            master[col] = master[col].astype('string[pyarrow]')
+    return master
+
+
+def _read_material(path):
+    return load_columnar(path, read_material_csv)
+
+
+def _read_stock(path):
+    return load_columnar(path, read_stock_csv)
+
+
+def _read_population(path):
+    return load_columnar(path, read_population_csv)
+
+
+# A per-material table with the row positions of each Material No
+def read_indexed(path):
+    table = load_columnar(path, read_material_csv)
+    return table, table.groupby('Material No', sort=False).indices
+
+
+# Rows for one material as an independent frame (empty if the material is unknown)
+def select_material(indexed, material_id):
+    table, index = indexed
+    positions = index.get(str(material_id))
+    if positions is None:
+        return table.iloc[0:0].copy()
+    return table.iloc[positions].copy()
+
+
+def lookup_material(path, material_id):
+    return lookup_material_versioned(path, material_id)[0]
+
+
+# Rows for one material and the fingerprint of the file they were read from
+def lookup_material_versioned(path, material_id):
+    indexed, version = memoize_versioned(path, read_indexed)
+    return select_material(indexed, material_id), version
+
+
+# Material numbers stocked at any of `plants`; a plant matches by its code
+# (first word of the Plant column, e.g. "11F2") or by the full plant name.
+def plant_materials(plants, path=STOCK_FILE):
+    stock = load_stock(path)
+    wanted = set(plants)
+    matches = stock['Plant'].isin(wanted) | stock['Plant'].str.split(n=1).str[0].isin(wanted)
+    return set(stock.loc[matches, 'Material No'].dropna())
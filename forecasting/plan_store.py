@@ -0,0 +1,86 @@
+import os
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from .cache import CACHE_DIR
+from .engine import FORECAST_DAYS
+from .planner import PLAN_COLUMNS, plan_reorders
+
+STORE_FILE = os.path.join(CACHE_DIR, "reorder_plans.parquet")
+GROUP_KEYS = ['Material No', 'oem']
+# Forecast columns the simulation reads; other columns (e.g. the CSV row number) do not affect a plan
+FORECAST_INPUTS = ['Desc', 'leadtime', 'year', 'cons_wip', 'cons_woip', 'buffer_stock']
+# Reorder points are stored as a day offset so a plan stays valid as the start date moves
+STORE_COLUMNS = GROUP_KEYS + ['input_hash', 'Desc', 'leadtime', 'reorder_day', 'reorder_qty', 'updated_reorder_qty', 'consider_pre_order']
+
+
+# Content hash of each group's rows. Row order inside a group matters (the first row
+# seeds the opening stock), so each row is hashed together with its position.
+def _row_hashes(table, keys, columns):
+    rows = table[keys + columns].assign(_position=table.groupby(keys, sort=False, dropna=False).cumcount())
+    hashed = rows[keys].assign(_hash=pd.util.hash_pandas_object(rows, index=False).to_numpy())
+    return hashed.groupby(keys, sort=False, dropna=False)['_hash'].sum().reset_index()
+
+
+# One hash per (Material No, oem) over its yearly forecast rows, its leadtime rows
+# and the simulation window (start year and horizon length)
+def input_hashes(df_yearly, leadtime=None, year=None, days=FORECAST_DAYS):
+    hashes = _row_hashes(df_yearly, GROUP_KEYS, FORECAST_INPUTS).rename(columns={'_hash': 'forecast_hash'})
+    hashes['leadtime_hash'] = np.uint64(0)
+    if leadtime is not None:
+        columns = [c for c in leadtime.columns if c != 'Material No' and not c.startswith('Unnamed')]
+        lead = _row_hashes(leadtime, ['Material No'], columns)
+        # Positional lookup rather than a left merge: a missing match would turn the
+        # uint64 column into float64 and round the hashes
+        found = pd.Index(lead['Material No']).get_indexer(hashes['Material No'])
+        hashes['leadtime_hash'] = np.where(found >= 0, lead['_hash'].to_numpy()[found], np.uint64(0)).astype('uint64')
+    parts = hashes[['forecast_hash', 'leadtime_hash']].assign(year=year, days=days)
+    hashes['input_hash'] = pd.util.hash_pandas_object(parts, index=False).to_numpy()
+    return hashes[GROUP_KEYS + ['input_hash']]
+
+
+def read_store(path=STORE_FILE):
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=STORE_COLUMNS).astype({'Material No': 'string', 'input_hash': 'uint64'})
+    return pd.read_parquet(path)
+
+
+def _write_store(store, path):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    store.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+# Reorder plan for every group in `df_yearly`, re-simulating only groups whose input hash
+# is not in the store. Entries for groups outside `df_yearly` are kept, so a run over a
+# subset of materials does not evict the rest. Returns (plan, counts).
+def replan(df_yearly, leadtime=None, start_date=None, end_date=None, store_path=STORE_FILE):
+    start_date = start_date or date.today()
+    end_date = end_date or start_date + timedelta(days=FORECAST_DAYS)
+    days = (end_date - start_date).days
+    hashes = input_hashes(df_yearly, leadtime, start_date.year, days)
+    store = read_store(store_path)
+
+    reused = store.merge(hashes, on=GROUP_KEYS + ['input_hash'], how='inner')
+    changed = hashes.merge(reused[GROUP_KEYS], on=GROUP_KEYS, how='left', indicator=True)
+    changed = changed[changed['_merge'] == 'left_only'].drop(columns='_merge')
+    rows = df_yearly.merge(changed[GROUP_KEYS], on=GROUP_KEYS, how='inner')
+
+    fresh = plan_reorders(rows, start_date=start_date, end_date=end_date)
+    fresh['reorder_day'] = [(d - start_date).days if d <= end_date else -1 for d in fresh['reorder_point']]
+    fresh = fresh.merge(changed, on=GROUP_KEYS, how='left')[STORE_COLUMNS]
+
+    if len(fresh):
+        untouched = store.merge(hashes[GROUP_KEYS], on=GROUP_KEYS, how='left', indicator=True)
+        untouched = untouched[untouched['_merge'] == 'left_only'].drop(columns='_merge')
+        _write_store(pd.concat([untouched, reused, fresh], ignore_index=True)[STORE_COLUMNS], store_path)
+
+    plan = hashes[GROUP_KEYS].merge(pd.concat([reused[STORE_COLUMNS], fresh], ignore_index=True), on=GROUP_KEYS, how='inner')
+    no_reorder = end_date + timedelta(days=2)
+    plan['reorder_point'] = [start_date + timedelta(days=int(d)) if d >= 0 else no_reorder for d in plan['reorder_day']]
+    plan['consider_pre_order'] = plan['consider_pre_order'].astype(bool)
+    counts = {'reused': len(reused), 'recomputed': len(fresh), 'skipped': len(changed) - len(fresh)}
+    return plan[PLAN_COLUMNS], counts
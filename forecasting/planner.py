@@ -0,0 +1,81 @@
+from datetime import date, timedelta
+
+import numpy as np
+
+from .engine import FORECAST_DAYS
+
+PLAN_COLUMNS = ['Material No', 'oem', 'Desc', 'leadtime', 'reorder_point', 'reorder_qty', 'updated_reorder_qty', 'consider_pre_order']
+
+
+# Per (Material No, oem) yearly constants for the whole table in one pass.
+# Groups without a row for `year` are left out; run those through make_daywise_forecast.
+def _fleet_constants(df_yearly, year):
+    keys = ['Material No', 'oem']
+    first = df_yearly.drop_duplicates(keys)[keys + ['Desc', 'leadtime', 'cons_wip', 'buffer_stock']]
+    current = df_yearly[df_yearly['year'] == year].drop_duplicates(keys)[keys + ['cons_wip', 'cons_woip', 'buffer_stock']]
+    fleet = first.merge(current, on=keys, how='inner', suffixes=('_first', ''))
+    initial_stock = fleet['cons_wip_first'].to_numpy() * 2
+    buffer_first = fleet['buffer_stock_first'].to_numpy()
+    fleet['opening'] = np.where(buffer_first < initial_stock, initial_stock, buffer_first * 1.2)
+    fleet['daily_cons'] = fleet['cons_wip'] / 365
+    fleet['anticipated_consum'] = fleet['cons_woip'] * fleet['leadtime'] / 365
+    return fleet.reset_index(drop=True)
+
+
+# Reorder decisions for a block of materials, simulated as a (materials x days) array.
+# An optional growth_rate column compounds each row's consumption yearly from the start
+# date; the reorder quantity then uses the consumption rates in force on the reorder day.
+def _plan_block(fleet, days):
+    n = len(fleet)
+    leadtime = fleet['leadtime'].to_numpy().astype(int)
+    buffer_stock = fleet['buffer_stock'].to_numpy().astype(float)
+    cons_wip = fleet['cons_wip'].to_numpy().astype(float)
+    anticipated = fleet['anticipated_consum'].to_numpy()
+
+    daily_cons = np.repeat(fleet['daily_cons'].to_numpy()[:, None], days, axis=1)
+    growth = None
+    if 'growth_rate' in fleet.columns:
+        growth = (1 + fleet['growth_rate'].to_numpy()[:, None]) ** (np.arange(days) / 365)
+        daily_cons *= growth
+    steps = daily_cons.copy()
+    steps[:, 0] = fleet['opening'].to_numpy()
+    present_stock = np.maximum(np.subtract.accumulate(steps, axis=1), 0)
+
+    below = present_stock[:, 1:] < buffer_stock[:, None]
+    has_reorder = below.any(axis=1)
+    idx = np.where(has_reorder, below.argmax(axis=1) + 1, 0)
+    rows = np.arange(n)
+    if growth is not None:
+        cons_wip, anticipated = cons_wip * growth[rows, idx], anticipated * growth[rows, idx]
+
+    reorder_qty = np.where(has_reorder, cons_wip + anticipated + buffer_stock - present_stock[rows, idx], 0.0)
+    stock_check = idx + 365 + leadtime
+    in_horizon = has_reorder & (stock_check < days)
+    consider_pre_order = in_horizon & (present_stock[rows, np.where(in_horizon, stock_check, 0)] == 0)
+    consumed = np.cumsum(daily_cons, axis=1)[rows, idx]
+    updated_reorder_qty = np.where(consider_pre_order, reorder_qty - consumed, 0.0)
+    return idx, has_reorder, np.ceil(reorder_qty), np.ceil(updated_reorder_qty), consider_pre_order
+
+
+# Fleet-wide reorder plan: one row per (Material No, oem), same decisions as make_daywise_forecast
+def plan_reorders(df_yearly, oem=None, start_date=None, end_date=None, chunk_size=2048):
+    start_date = start_date or date.today()
+    end_date = end_date or start_date + timedelta(days=FORECAST_DAYS)
+    days = (end_date - start_date).days
+    if oem is not None:
+        df_yearly = df_yearly[df_yearly['oem'] == oem]
+    fleet = _fleet_constants(df_yearly, start_date.year)
+
+    blocks = [_plan_block(fleet.iloc[i:i + chunk_size], days) for i in range(0, len(fleet), chunk_size)]
+    if blocks:
+        idx, has_reorder, reorder_qty, updated_reorder_qty, consider_pre_order = (np.concatenate(parts) for parts in zip(*blocks))
+    else:
+        idx = has_reorder = reorder_qty = updated_reorder_qty = consider_pre_order = np.empty(0)
+
+    no_reorder = end_date + timedelta(days=2)
+    plan = fleet[['Material No', 'oem', 'Desc', 'leadtime']].copy()
+    plan['reorder_point'] = [start_date + timedelta(days=int(i)) if r else no_reorder for i, r in zip(idx, has_reorder)]
+    plan['reorder_qty'] = reorder_qty
+    plan['updated_reorder_qty'] = updated_reorder_qty
+    plan['consider_pre_order'] = consider_pre_order.astype(bool)
+    return plan[PLAN_COLUMNS]
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+from .cache import read_material_csv
+
+# Installed quantity column of the population table
+POPULATION_COLUMN = 'Population'
+DEMAND_COLUMNS = ['Material No', 'Material Description', POPULATION_COLUMN, 'K Factor', 'MTBR', 'horizon_days', 'reliability', 'failure_demand']
+
+
+# Weibull reliability with MTBR as the scale and K Factor as the shape:
+# R(t) = exp(-(t / MTBR) ** K). reliability.csv's Reliability_365days is this at t = 365.
+# Arguments broadcast, so one call covers every material and horizon.
+def reliability_at(mtbr, k_factor, horizon_days):
+    horizon_days = np.asarray(horizon_days, dtype=float)
+    return np.exp(-(horizon_days / np.asarray(mtbr, dtype=float)) ** np.asarray(k_factor, dtype=float))
+
+
+# Population table: Material No -> installed quantity; repeated materials are summed
+def read_population_csv(path):
+    for population in read_material_csv(path):
+        population[POPULATION_COLUMN] = pd.to_numeric(population[POPULATION_COLUMN], errors='coerce').fillna(0)
+        yield population.groupby('Material No', sort=False, as_index=False)[POPULATION_COLUMN].sum()
+
+
+# Reliability rows usable by the Weibull model: one per material (reliability.csv repeats a
+# material once per equipment with the same K Factor and MTBR), with positive, finite
+# MTBR and K Factor
+def _weibull_parameters(reliability):
+    params = reliability.drop_duplicates('Material No')[['Material No', 'Material Description', 'K Factor', 'MTBR']]
+    mtbr = pd.to_numeric(params['MTBR'], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    k_factor = pd.to_numeric(params['K Factor'], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    return params[np.isfinite(mtbr) & np.isfinite(k_factor) & (mtbr > 0) & (k_factor > 0)]
+
+
+# Failure-driven demand (1 - R(t)) * N for every material in `population` and every horizon,
+# as one (materials x horizons) array; one row per material and horizon. Materials without
+# usable MTBR/K Factor are left out; a missing or negative population counts as 0.
+def reliability_demand(reliability, population, horizons=(365,)):
+    population = population[['Material No', POPULATION_COLUMN]].copy()
+    population[POPULATION_COLUMN] = pd.to_numeric(population[POPULATION_COLUMN], errors='coerce').fillna(0).clip(lower=0)
+    base = population.merge(_weibull_parameters(reliability), on='Material No', how='inner')
+    horizons = np.asarray(horizons, dtype=float)
+    rf = reliability_at(base['MTBR'].to_numpy()[:, None], base['K Factor'].to_numpy()[:, None], horizons[None, :])
+    demand = base.loc[base.index.repeat(len(horizons))].reset_index(drop=True)
+    demand['horizon_days'] = np.tile(horizons, len(base)).astype(int)
+    demand['reliability'] = rf.ravel()
+    demand['failure_demand'] = (1 - demand['reliability']) * demand[POPULATION_COLUMN]
+    return demand[DEMAND_COLUMNS]
+
+
+# Expected failures per material and forecast year. The installed base is taken as new at
+# the start of `start_year` and failed units are replaced, so year k (from 0) loses
+# N * (1 - R(365 (k + 1)) / R(365 k)) units: the chance that a unit surviving to the start of
+# the year fails within it. For K Factor > 1 this rises year on year; year 0 is (1 - R(365)) * N.
+def yearly_failure_demand(reliability, population, start_year, end_year):
+    years = np.arange(start_year, end_year + 1)
+    bounds = reliability_demand(reliability, population, horizons=365 * np.arange(len(years) + 1))
+    rf = bounds['reliability'].to_numpy().reshape(-1, len(years) + 1)
+    materials = bounds['Material No'].to_numpy()[::len(years) + 1]
+    quantity = bounds[POPULATION_COLUMN].to_numpy()[::len(years) + 1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # A survival probability that underflowed to 0 means every unit has failed by then
+        surviving = np.where(rf[:, :-1] > 0, rf[:, 1:] / rf[:, :-1], 0.0)
+    return pd.DataFrame({
+        'Material No': np.repeat(materials, len(years)),
+        'year': np.tile(years, len(materials)),
+        'reliability_demand': ((1 - surviving) * quantity[:, None]).ravel(),
+    })
+
+
+# Yearly forecast rows with each material's failure demand for that year (see
+# yearly_failure_demand; the base is new at start_year, default the first forecast year)
+# added to its consumption (cons_wip and cons_woip). The added amount is kept in
+# reliability_demand; materials without a population or usable reliability row get 0.
+def add_reliability_demand(df_yearly, reliability, population, start_year=None):
+    years = df_yearly['year'].astype(int)
+    start_year = int(years.min()) if start_year is None else start_year
+    demand = yearly_failure_demand(reliability, population, start_year, max(int(years.max()), start_year))
+    demand['year'] = demand['year'].astype(df_yearly['year'].dtype)
+    planned = df_yearly.merge(demand, on=['Material No', 'year'], how='left')
+    planned['reliability_demand'] = planned['reliability_demand'].fillna(0.0)
+    planned['cons_wip'] = planned['cons_wip'] + planned['reliability_demand']
+    planned['cons_woip'] = planned['cons_woip'] + planned['reliability_demand']
+    return planned
@@ -0,0 +1,59 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from .engine import FORECAST_DAYS
+from .planner import _fleet_constants, _plan_block
+
+SCENARIO_PARAMETERS = ['leadtime', 'buffer_multiplier', 'stock_multiplier', 'growth_rate']
+SCENARIO_COLUMNS = ['Material No', 'oem'] + SCENARIO_PARAMETERS + [
+    'reorder_day', 'reorder_point', 'reorder_qty', 'updated_reorder_qty', 'consider_pre_order',
+]
+
+
+# Reorder plan for every combination of the parameter grid, for one or many materials.
+# Each (material, scenario) pair is one row of the batched (rows x days) simulation,
+# so the whole grid costs one planner pass rather than one simulation per scenario.
+#   leadtimes           lead time in days; None keeps the material's own
+#   buffer_multipliers  scale the buffer (safety) stock
+#   stock_multipliers   scale the opening stock
+#   growth_rates        yearly consumption growth, compounded daily (0.1 = +10% a year)
+# The base scenario (None, 1, 1, 0) reproduces plan_reorders. reorder_day is -1 when
+# no reorder falls inside the horizon.
+def sweep_scenarios(df_yearly, materials=None, oem=None, leadtimes=(None,), buffer_multipliers=(1.0,),
+                    stock_multipliers=(1.0,), growth_rates=(0.0,), start_date=None, end_date=None, chunk_size=2048):
+    start_date = start_date or date.today()
+    end_date = end_date or start_date + timedelta(days=FORECAST_DAYS)
+    days = (end_date - start_date).days
+    if materials is not None:
+        df_yearly = df_yearly[df_yearly['Material No'].isin([str(m) for m in materials])]
+    if oem is not None:
+        df_yearly = df_yearly[df_yearly['oem'] == oem]
+    fleet = _fleet_constants(df_yearly, start_date.year)
+
+    grid = pd.DataFrame(
+        [(lt, b, s, g) for lt in leadtimes for b in buffer_multipliers for s in stock_multipliers for g in growth_rates],
+        columns=['leadtime_override'] + SCENARIO_PARAMETERS[1:],
+    )
+    rows = fleet.merge(grid, how='cross')
+    override = pd.to_numeric(rows['leadtime_override'], errors='coerce')
+    rows['leadtime'] = override.fillna(rows['leadtime']).astype(int)
+    rows['anticipated_consum'] = rows['cons_woip'] * rows['leadtime'] / 365
+    rows['buffer_stock'] = rows['buffer_stock'] * rows['buffer_multiplier']
+    rows['opening'] = rows['opening'] * rows['stock_multiplier']
+
+    blocks = [_plan_block(rows.iloc[i:i + chunk_size], days) for i in range(0, len(rows), chunk_size)]
+    if blocks:
+        idx, has_reorder, reorder_qty, updated_reorder_qty, consider_pre_order = (np.concatenate(parts) for parts in zip(*blocks))
+    else:
+        idx = has_reorder = reorder_qty = updated_reorder_qty = consider_pre_order = np.empty(0)
+
+    no_reorder = end_date + timedelta(days=2)
+    result = rows[['Material No', 'oem'] + SCENARIO_PARAMETERS].copy()
+    result['reorder_day'] = np.where(has_reorder, idx, -1).astype(int)
+    result['reorder_point'] = [start_date + timedelta(days=int(i)) if r else no_reorder for i, r in zip(idx, has_reorder)]
+    result['reorder_qty'] = reorder_qty
+    result['updated_reorder_qty'] = updated_reorder_qty
+    result['consider_pre_order'] = consider_pre_order.astype(bool)
+    return result[SCENARIO_COLUMNS]
@@ -0,0 +1,116 @@
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+
+from .charts import inventory_traces
+from .engine import FORECAST_DAYS, simulate_daywise
+
+MAX_ENTRIES = 256
+MAX_BYTES = 64 * 2 ** 20
+
+
+# Process-wide LRU of day-wise simulations, bounded by entry count and by the
+# deep size of the cached frames. Simulations start from date.today(), so every
+# entry is dropped when the day rolls over.
+class SimulationCache:
+    def __init__(self, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._day = None
+        self._counts = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+
+    def _expire(self, today):
+        if today != self._day:
+            self._counts['expirations'] += len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+            self._day = today
+
+    def get(self, key, today=None):
+        with self._lock:
+            self._expire(today or date.today())
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counts['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counts['hits'] += 1
+            return entry[0]
+
+    def put(self, key, value, size, today=None):
+        with self._lock:
+            self._expire(today or date.today())
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self._counts['evictions'] += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self._counts['hits'] + self._counts['misses']
+            return {
+                **self._counts,
+                'hit_rate': self._counts['hits'] / lookups if lookups else None,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+simulation_cache = SimulationCache()
+
+
+# Rows of one material/oem, in file order
+def _material_rows(df_yearly, mat, oem):
+    df = df_yearly[(df_yearly['Material No'] == mat) & (df_yearly['oem'] == oem)]
+    if df.empty:
+        raise ValueError(f"No forecast data for material {mat} (oem {oem})")
+    return df
+
+
+# Simulation result, reorder plan and downsampled chart traces for one material, through
+# the shared cache keyed by (material, oem, start date, horizon, version). `version`
+# identifies the data df_yearly was loaded from, e.g. the fingerprint returned with it by
+# lookup_material_versioned(), so a hit touches neither the frame nor its rows.
+def _cached_simulation(df_yearly, mat, oem, version, end_date, start_date, cache):
+    today = date.today()
+    start_date = start_date or today
+    end_date = end_date or start_date + timedelta(days=FORECAST_DAYS)
+    key = (str(mat), oem, start_date, (end_date - start_date).days, version)
+
+    cached = cache.get(key, today)
+    if cached is None:
+        df = _material_rows(df_yearly, mat, oem)
+        daywise, plan = simulate_daywise(df, mat, start_date, end_date)
+        traces = inventory_traces(daywise, plan)
+        for x, y in traces.values():
+            x.flags.writeable = y.flags.writeable = False
+        size = int(daywise.memory_usage(deep=True).sum()) + sum(x.nbytes + y.nbytes for x, y in traces.values())
+        cached = (daywise, plan, traces)
+        cache.put(key, cached, size, today)
+    return cached
+
+
+# make_daywise_forecast through the shared cache.
+# Callers get their own copy of the frame, so they may modify it.
+def cached_daywise_forecast(df_yearly, mat, oem, version, end_date=None, start_date=None, cache=simulation_cache):
+    daywise, plan, _ = _cached_simulation(df_yearly, mat, oem, version, end_date, start_date, cache)
+    return daywise.copy(), dict(plan)
+
+
+# Reorder plan and the Inventory Level chart traces ({name: (dates, values)}, read-only
+# arrays) without copying the day-wise frame
+def cached_inventory_chart(df_yearly, mat, oem, version, end_date=None, start_date=None, cache=simulation_cache):
+    _, plan, traces = _cached_simulation(df_yearly, mat, oem, version, end_date, start_date, cache)
+    return dict(plan), traces
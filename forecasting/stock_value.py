@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .cache import CHUNK_ROWS
+
+# Text columns kept from the stock export; the grouping columns for rollups and the plant lookup
+STOCK_TEXT_COLUMNS = ['Plant', 'Material', 'MRP Controller', 'Material type', 'Material Group']
+AMOUNT_COLUMNS = ['Val. stock', 'ValStckVal', 'CnsgtStock', 'Val.Stock in May 2025', 'Increase']
+# Valuation snapshots in the stock export, oldest first
+SNAPSHOTS = {'Mar 2024': 'ValStckVal', 'May 2025': 'Val.Stock in May 2025'}
+ROLLUP_DIMENSIONS = ['Plant', 'Material type', 'Material Group', 'MRP Controller']
+
+
+# Currency/quantity text such as "7,25,92,853.32" -> float; numeric columns pass through.
+# Dropping the grouping commas and casting in Arrow handles a clean column in one pass;
+# a column with other junk (symbols, stray text) goes through a regex that strips all but
+# digits, the decimal point and the sign.
+def parse_amount(series):
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype(float)
+    text = pc.utf8_trim_whitespace(pc.replace_substring(pa.array(series, type=pa.string(), from_pandas=True), ',', ''))
+    try:
+        return pd.Series(pc.cast(text, pa.float64()).to_numpy(zero_copy_only=False), index=series.index, name=series.name)
+    except pa.ArrowInvalid:
+        return pd.to_numeric(series.astype(str).str.replace(r'[^\d.\-]', '', regex=True), errors='coerce').astype(float)
+
+
+# Stock value export: latin1, BOM left on the first header, Indian-format currency text.
+# Read in chunks as text; amounts are parsed per chunk. Where a header repeats (the unit
+# columns next to each amount), usecols keeps the first, which holds the amount.
+def read_stock_csv(path, chunksize=CHUNK_ROWS):
+    wanted = set(STOCK_TEXT_COLUMNS + AMOUNT_COLUMNS)
+    chunks = pd.read_csv(path, encoding='latin1', usecols=lambda c: c.replace('ï»¿', '') in wanted, dtype='str', chunksize=chunksize)
+    for stock in chunks:
+        stock.columns = [c.replace('ï»¿', '') for c in stock.columns]
+        for col in AMOUNT_COLUMNS:
+            if col in stock.columns:
+                stock[col] = parse_amount(stock[col])
+        if 'Material' in stock.columns:
+            stock['Material No'] = stock['Material'].str.split(n=1).str[0].astype('string')
+        yield stock
+
+
+# Snapshot totals by every rollup dimension. One group-by over all dimensions
+# produces the finest grain; each per-dimension rollup is then summed from that.
+def stock_rollups(stock, dimensions=ROLLUP_DIMENSIONS, snapshots=SNAPSHOTS):
+    dimensions = [d for d in dimensions if d in stock.columns]
+    values = stock[list(snapshots.values())].rename(columns={v: k for k, v in snapshots.items()})
+    values[dimensions] = stock[dimensions].fillna('Unassigned')
+    base = values.groupby(dimensions, sort=False).sum()
+    rollups = {d: base.groupby(level=d).sum().sort_values(list(snapshots)[-1], ascending=False) for d in dimensions}
+    rollups['Total'] = base.sum().to_frame().T.rename(index={0: 'Total'})
+    return rollups
+
+
+# Totals per snapshot as a (Snapshot, Amount) trend table
+def snapshot_trend(rollups):
+    totals = rollups['Total'].iloc[0]
+    return pd.DataFrame({'Snapshot': totals.index, 'Amount': totals.to_numpy(dtype=np.float64)})
+
@@ -1,8 +1,8 @@
+import importlib
+import sys
+
 import streamlit as st
-from dashboard import dashboard_page
-from data import load_main_data
-from material_search import material_search_page
-from notification import notification_page
+from profiling import current_trace, end_trace, is_enabled, span, start_trace
 
 # Page configuration
 st.set_page_config(page_title="Material Management", page_icon="🏭", layout="wide")
@@ -34,38 +34,77 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Page name -> (module, render function). A page module, and the plotting
+# libraries it uses, is only imported the first time its route is visited.
+PAGES = {
+    "Dashboard": ("dashboard", "dashboard_page"),
+    "Material Search": ("material_search", "material_search_page"),
+    "Notification": ("notification", "notification_page"),
+}
+
+def render_page(name):
+    module, function = PAGES[name]
+    getattr(importlib.import_module(module), function)()
+
+# Sidebar debug panel with the spans and cache hit/miss counts of this rerun
+def show_profile_panel(trace, trace_path):
+    with st.sidebar.expander("⏱ Profiling", expanded=True):
+        total = sum(duration for _, _, duration, depth in trace.spans if depth == 0)
+        st.caption(f"{trace.label}: {total * 1000:.0f} ms in top-level spans")
+        st.dataframe(trace.span_rows(), hide_index=True, use_container_width=True)
+        stats = trace.cache_stats()
+        if stats:
+            st.dataframe(stats, hide_index=True, use_container_width=True)
+        # Process-wide counters; only shown once a page has loaded the forecasting package
+        simulations = sys.modules.get('forecasting.sim_cache')
+        if simulations:
+            st.caption("Simulation cache (process-wide)")
+            st.dataframe([simulations.simulation_cache.stats()], hide_index=True, use_container_width=True)
+        if trace_path:
+            st.caption(f"Trace written to {trace_path}")
+
 # Main App Controller (unchanged from your original)
 def main():
     # Initialize session state for page navigation
     if 'current_page' not in st.session_state:
         st.session_state.current_page = "Material Search"
     
-    # Sidebar navigation
-    with st.sidebar:
-        st.title("InvOptima")
+    profiling = is_enabled(st.query_params)
+    if profiling:
+        start_trace(st.session_state.current_page)
+    
+    # st.rerun() (navigation buttons, View Details) and page errors leave by an exception;
+    # the trace is still closed and written, but the panel only shows for completed reruns
+    try:
+        # Sidebar navigation
+        with st.sidebar:
+            st.title("InvOptima")
         
-        if st.button("📊 Dashboard"):
-            st.session_state.current_page = "Dashboard"
-            st.rerun()
+            if st.button("📊 Dashboard"):
+                st.session_state.current_page = "Dashboard"
+                st.rerun()
 
-        if st.button("🔍 Material Search"):
-            st.session_state.current_page = "Material Search"
-            st.session_state.show_details = False
-            st.rerun()
+            if st.button("🔍 Material Search"):
+                st.session_state.current_page = "Material Search"
+                st.session_state.show_details = False
+                st.rerun()
 
-        if st.button("📊 Notification"):
-            st.session_state.current_page = "Notification"
-            st.rerun()
+            if st.button("📊 Notification"):
+                st.session_state.current_page = "Notification"
+                st.rerun()
         
-        st.markdown("---")
+            st.markdown("---")
     
-    # Page routing
-    if st.session_state.current_page == "Dashboard":
-        dashboard_page()
-    elif st.session_state.current_page == "Material Search":
-        material_search_page()
-    elif st.session_state.current_page == "Notification":
-        notification_page()
+        # Page routing
+        with span(f"page.{st.session_state.current_page}"):
+            render_page(st.session_state.current_page)
+    finally:
+        if profiling:
+            trace = current_trace()
+            trace_path = end_trace()
+
+    if profiling:
+        show_profile_panel(trace, trace_path)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
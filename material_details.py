@@ -1,12 +1,92 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-import matplotlib.pyplot as plt
-from data import load_additional_data, load_leadtime_data, load_reliability_data
-from datetime import date, timedelta, datetime
-import csv
+from data import load_additional_data, load_forecast_rows, load_leadtime_data, load_population_quantity, load_reliability_data
+from forecasting import cached_inventory_chart, reliability_at, sweep_scenarios
+from notification_store import get_writer
+from profiling import span, timed
+
+# Line style per Inventory Level trace
+TRACE_LINES = {
+    'Buffer Stock': dict(color='red', dash='dash'),
+    'Present Stock': dict(color='orange'),
+    'Stock After Replenishment': dict(color='green'),
+}
+
+# Inventory Level chart: buffer stock, stock before delivery and stock after replenishment.
+# The traces come downsampled from the simulation cache and are drawn with WebGL.
+@timed("details.build_inventory_figure")
+def build_inventory_figure(traces):
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    for name, (x, y) in traces.items():
+        fig.add_trace(go.Scattergl(
+            x=x,
+            y=y,
+            mode='lines',
+            name=name,
+            line=TRACE_LINES[name],
+            hoverinfo='y+name'
+        ))
+
+    # Customize layout
+    fig.update_layout(
+        title="Inventory Level",
+        xaxis_title="Date",
+        yaxis_title="Stock Level",
+        hovermode="x unified",
+        height=600,
+        showlegend=True
+    )
+    return fig
+
+BUFFER_MULTIPLIERS = [0.5, 0.75, 1.0, 1.25, 1.5, 2.0]
+STOCK_MULTIPLIERS = [0.5, 0.75, 1.0, 1.5, 2.0]
+GROWTH_RATES = [-0.1, 0.0, 0.05, 0.1, 0.2]
+SCENARIO_METRICS = {'Days until reorder': 'reorder_day', 'Reorder quantity': 'reorder_qty', 'Pre-order quantity': 'updated_reorder_qty'}
+
+# What-if grid over lead time, buffer stock, opening stock and consumption growth,
+# evaluated in one batched run, shown as a lead time x buffer heatmap plus the full table
+def show_scenario_sweep(forecasted, material_id, oem, leadtime):
+    import plotly.express as px
+
+    st.subheader("Reorder Policy Scenarios")
+    leadtime = int(leadtime)
+    col1, col2, col3, col4 = st.columns(4)
+    low, high = col1.slider("Lead time range (days)", 0, max(2 * leadtime, 30), (leadtime // 2, leadtime + leadtime // 2))
+    leadtimes = sorted({round(low + (high - low) * i / 5) for i in range(6)})
+    buffers = col2.multiselect("Buffer stock ×", BUFFER_MULTIPLIERS, default=BUFFER_MULTIPLIERS)
+    stocks = col3.multiselect("Opening stock ×", STOCK_MULTIPLIERS, default=[1.0])
+    rates = col4.multiselect("Consumption growth / year", GROWTH_RATES, default=[0.0], format_func=lambda g: f"{g:+.0%}")
+    if not (buffers and stocks and rates):
+        st.info("Pick at least one value for each scenario parameter")
+        return
+
+    with span("details.scenarios"):
+        results = sweep_scenarios(forecasted, materials=[material_id], oem=oem, leadtimes=leadtimes,
+                                  buffer_multipliers=buffers, stock_multipliers=stocks, growth_rates=rates)
+    if results.empty:
+        st.info("No scenarios could be simulated for this material")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    metric = col1.selectbox("Heatmap value", list(SCENARIO_METRICS))
+    stock = col2.selectbox("Show opening stock ×", sorted(stocks))
+    rate = col3.selectbox("Show consumption growth", sorted(rates), format_func=lambda g: f"{g:+.0%}")
+    view = results[(results['stock_multiplier'] == stock) & (results['growth_rate'] == rate)]
+    values = view[SCENARIO_METRICS[metric]]
+    if metric == 'Days until reorder':
+        # -1: no reorder inside the forecast horizon
+        values = values.where(values >= 0)
+    grid = view.assign(value=values).pivot(index='buffer_multiplier', columns='leadtime', values='value')
+    fig = px.imshow(grid, text_auto=True, aspect='auto', origin='lower',
+                    labels={'x': 'Lead time (days)', 'y': 'Buffer stock ×', 'color': metric})
+    fig.update_xaxes(type='category')
+    fig.update_yaxes(type='category')
+    st.plotly_chart(fig, use_container_width=True)
+
+    with st.expander(f"All {len(results)} scenarios"):
+        st.dataframe(results, hide_index=True, use_container_width=True)
 
 # Function to display material details with the new requirements
 def show_material_details(material_id, main_data):
@@ -69,65 +149,8 @@ def show_material_details(material_id, main_data):
 
         # st.divider()
 
-        # Load data
-        @st.cache_data
-        def load_data():
-            return pd.read_csv('files/forecasted.csv')
-
-        forecasted = load_data()
-        forecasted['Material No'] = forecasted['Material No'].astype(str)
-
-        def makedaywiseForecast(df_yearly,mat,oem,end_date=date.today()+timedelta(days=365*5),initial_stock=10):
-            daywiseForecast = pd.DataFrame(columns=['Material No','Desc','leadtime','date','daily_cons','anticipated_consum','buffer_stock','present_stock','stock_after'])
-            df=df_yearly.copy()
-            df=df[(df['Material No']==mat)&(df['oem']==oem)].reset_index(drop=True)
-            consider_pre_order = False
-            start_date = date.today()
-            days = (end_date-start_date).days
-            initial_stock = df.at[0,'cons_wip']*2
-            daywiseForecast.at[0,'present_stock'] = initial_stock if df.at[0,'buffer_stock'] < initial_stock else df.at[0,'buffer_stock']*1.2
-            daywiseForecast.at[0,'stock_after']=daywiseForecast.at[0,'present_stock']
-            reorder_point=end_date+timedelta(days=2)
-            reorder_qty,updated_reorder_qty=0,0
-            first_reorder=False
-            leadtime = df['leadtime'].iloc[0]
-            arrival={}
-            for i in range(days):
-                daywiseForecast.at[i,'date']=start_date+timedelta(days=i)
-                daywiseForecast.at[i,'anticipated_consum']=df.loc[df['year']==date.today().year,'cons_woip'].iloc[0]*leadtime/365
-                daywiseForecast.at[i,'buffer_stock']=df.loc[df['year']==date.today().year,'buffer_stock'].iloc[0]
-                daywiseForecast.at[i,'daily_cons']=df.loc[df['year']==date.today().year,'cons_wip'].iloc[0]/365
-                if i>0:
-                    if i in arrival.keys():
-                        arrived_qty = arrival[i]
-                    else:
-                        arrived_qty=0
-                    daywiseForecast.at[i,'present_stock']=max(daywiseForecast.at[i-1,'present_stock']-daywiseForecast.at[i-1,'daily_cons'],0)
-                    daywiseForecast.at[i,'stock_after']=max(daywiseForecast.at[i-1,'stock_after']-daywiseForecast.at[i-1,'daily_cons'],0)+arrived_qty
-                    if not first_reorder:
-                        if daywiseForecast.at[i,'present_stock']< daywiseForecast.at[i,'buffer_stock']:
-                            reorder_point = daywiseForecast.at[i,'date']
-                            first_reorder = True
-                            current_year=daywiseForecast.at[i,'date'].year
-                            reorder_qty = df.loc[df['year']==date.today().year,'cons_wip'].iloc[0] + daywiseForecast.at[i,'anticipated_consum'] +  daywiseForecast.at[i,'buffer_stock'] - daywiseForecast.at[i, 'present_stock']
-                            arrival[i+leadtime]=reorder_qty
-            daywiseForecast['Material No']=mat
-            daywiseForecast['Desc']=df.at[0,'Desc']
-            daywiseForecast['leadtime']=df['leadtime'].iloc[0]
-            date_for_stock_check = reorder_point+timedelta(days=(365+int(leadtime)))
-            if date_for_stock_check < end_date:
-                if daywiseForecast[daywiseForecast['date']==date_for_stock_check]['present_stock'].iloc[0] == 0:
-                    consider_pre_order = True
-                    updated_period = daywiseForecast[daywiseForecast['date'].between(date.today(),reorder_point)]
-                    updated_reorder_qty = reorder_qty - updated_period['daily_cons'].values.sum()
-            return daywiseForecast.reset_index(drop=True),{
-                'reorder_point':reorder_point,
-                'reorder_qty': np.ceil(reorder_qty),
-                'updated_reorder_qty':np.ceil(updated_reorder_qty),
-                'consider_pre_order':consider_pre_order,
-                'leadtime':leadtime
-            }
-
+        # The simulation cache is keyed by the version of the file these rows were read from
+        forecasted, forecast_version = load_forecast_rows(material_id)
 
         # User inputs
         oem = "atlas"
@@ -136,7 +159,8 @@ def show_material_details(material_id, main_data):
         try:
             ordering_required = {}
             ordering_required[material_id]={}
-            df, ordering_required[material_id] = makedaywiseForecast(forecasted, material_id, 'atlas')
+            with span("details.simulation"):
+                ordering_required[material_id], traces = cached_inventory_chart(forecasted, material_id, 'atlas', forecast_version)
             leadtime = ordering_required[material_id]['leadtime']
             reorder_point = ordering_required[material_id]['reorder_point']
             delivery_date = reorder_point + pd.DateOffset(days=leadtime)
@@ -151,51 +175,14 @@ def show_material_details(material_id, main_data):
             col5.metric("Safety Stock", safety_stock)
 
             # Plot
-            df['date'] = pd.to_datetime(df['date'])
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=df['date'],
-                y=df['buffer_stock'],
-                mode='lines',
-                name='Buffer Stock',
-                line=dict(color='red', dash='dash'),
-                hoverinfo='y+name'
-            ))
-
-            # Present stock (only before delivery)
-            present_before_delivery = df[df['date'] < delivery_date]
-            fig.add_trace(go.Scatter(
-                x=present_before_delivery['date'],
-                y=present_before_delivery['present_stock'],
-                mode='lines',
-                name='Present Stock',
-                line=dict(color='orange'),
-                hoverinfo='y+name'
-            ))
-
-            # Stock after replenishment
-            stock_after = df[df['date'] >= delivery_date]
-            fig.add_trace(go.Scatter(
-                x=stock_after['date'],
-                y=stock_after['stock_after'],
-                mode='lines',
-                name='Stock After Replenishment',
-                line=dict(color='green'),
-                hoverinfo='y+name'
-            ))
-
-            # Customize layout
-            fig.update_layout(
-                title="Inventory Level",
-                xaxis_title="Date",
-                yaxis_title="Stock Level",
-                hovermode="x unified",
-                height=600,
-                showlegend=True
-            )
+            fig = build_inventory_figure(traces)
 
             # Display the plot
-            st.plotly_chart(fig, use_container_width=True)
+            with span("details.render_chart"):
+                st.plotly_chart(fig, use_container_width=True)
+
+            st.divider()
+            show_scenario_sweep(forecasted, material_id, 'atlas', leadtime)
 
         except Exception as e:
             st.error(f"An error occurred: {str(e)}")
@@ -205,12 +192,19 @@ def show_material_details(material_id, main_data):
         # Calculating Reliabilty woth Population Input
         reliability_data = load_reliability_data(material_id) 
         st.subheader("Reliability Dashboard")
-        population = st.number_input("Total Population (N)")
-        reliability_factor = reliability_data["Reliability_365days"].iloc[0]
-        reliability_forcasted_qty = round((1-reliability_factor)*population, 2)
-        col1, col2 = st.columns(2)
-        col1.metric("Reliability Factor (RF)", round(reliability_factor,4))
-        col2.metric("Reliability Forecasted Quantity ((1-RF)*N)",reliability_forcasted_qty)
+        if reliability_data is None or reliability_data.empty:
+            st.info("No reliability data available for this material")
+        else:
+            col_n, col_t = st.columns(2)
+            population = col_n.number_input("Total Population (N)", value=load_population_quantity(material_id))
+            horizon = col_t.number_input("Horizon (days)", min_value=1, value=365, step=30)
+            # RF over any horizon from MTBR and K Factor; at 365 days this is Reliability_365days
+            params = reliability_data.iloc[0]
+            reliability_factor = float(reliability_at(params["MTBR"], params["K Factor"], horizon))
+            reliability_forcasted_qty = round((1-reliability_factor)*population, 2)
+            col1, col2 = st.columns(2)
+            col1.metric(f"Reliability Factor (RF, {horizon} days)", round(reliability_factor,4))
+            col2.metric("Reliability Forecasted Quantity ((1-RF)*N)",reliability_forcasted_qty)
 
 
         st.divider()
@@ -219,15 +213,7 @@ def show_material_details(material_id, main_data):
         if present_stock_sim < safety_stock:
             st.write("User Notified. Check Notification for further action.")
 
-            filename = "files/notification.csv"
-            current_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            data = [current_date, material_id, present_stock, safety_stock]
-            
-            with open(filename, 'a', newline='') as file:
-                writer = csv.writer(file)
-                if file.tell() == 0:
-                    writer.writerow(['Date', 'Material ID', 'Present Stock', 'Safety Stock'])
-                writer.writerow(data)
+            get_writer().notify(material_id, present_stock, safety_stock)
             
     else:
         st.warning("No additional forecast data available for this material")
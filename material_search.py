@@ -1,6 +1,8 @@
 import streamlit as st
-from data import load_main_data
-from material_details import show_material_details
+import numpy as np
+from data import load_facet_index, load_main_data, load_search_index
+
+PAGE_SIZES = [25, 50, 100]
 
 # Material Search Page (unchanged from your original)
 def material_search_page():
@@ -10,6 +12,8 @@ def material_search_page():
         st.session_state.selected_material = None
 
     if st.session_state.show_details and st.session_state.selected_material:
+        # The details page pulls in plotly; only load it once a material is opened
+        from material_details import show_material_details
         data = load_main_data()
         if data is not None:
             show_material_details(st.session_state.selected_material, data)
@@ -29,54 +33,64 @@ def material_search_page():
         st.subheader("Search Materials")
         
         col1, col2, col3 = st.columns(3)
+        facets = load_facet_index()
+        selections = {}
         
         with col1:
-            if 'Manufacturer Name' in data.columns:
-                manufacturers = ['All'] + sorted(data['Manufacturer Name'].dropna().unique().tolist())
-                selected_manf = st.selectbox("Filter by Manufacturer", manufacturers)
+            if 'Manufacturer Name' in facets.columns:
+                manufacturers = ['All'] + facets.options('Manufacturer Name')
+                selections['Manufacturer Name'] = st.selectbox("Filter by Manufacturer", manufacturers, format_func=facets.label('Manufacturer Name'))
         
         with col2:
-            if 'Plant Code' in data.columns:
-                plants = ['All'] + sorted(data['Plant Code'].dropna().unique().tolist())
-                selected_plant = st.selectbox("Filter by Plant Code", plants)
+            if 'Plant Code' in facets.columns:
+                plants = ['All'] + facets.options('Plant Code')
+                selections['Plant Code'] = st.selectbox("Filter by Plant Code", plants, format_func=facets.label('Plant Code'))
             
-            if 'Material Type' in data.columns:
-                material_types = ['All'] + sorted(data['Material Type'].dropna().unique().tolist())
-                selected_type = st.selectbox("Filter by Material Type", material_types)
+            if 'Material Type' in facets.columns:
+                material_types = ['All'] + facets.options('Material Type')
+                selections['Material Type'] = st.selectbox("Filter by Material Type", material_types, format_func=facets.label('Material Type'))
 
         with col3:
-            search_term = st.text_input("Search by Material No")
+            search_term = st.text_input("Search by Material No, Description or Mfr Part No")
         
-        filtered_data = data.copy()
+        # Facet selections resolve to row positions; the frame is sliced once at the end
+        rows = facets.select(selections)
         
+        # Ranked row positions from the prebuilt index; best matches come first
         if search_term:
-            if 'Material No' in filtered_data.columns:
-                filtered_data = filtered_data[
-                    filtered_data['Material No'].astype(str).str.contains(search_term, case=False, na=False)
-                ]
-        
-        if 'Manufacturer Name' in data.columns and selected_manf != 'All':
-            filtered_data = filtered_data[filtered_data['Manufacturer Name'] == selected_manf]
-
-        if 'Plant Code' in data.columns and selected_plant != 'All':
-            filtered_data = filtered_data[filtered_data['Plant Code'] == selected_plant]
+            hits = load_search_index().search(search_term)
+            rows = hits if rows is None else hits[np.isin(hits, rows)]
         
-        if 'Material Type' in data.columns and selected_type != 'All':
-            filtered_data = filtered_data[filtered_data['Material Type'] == selected_type]
+        total = len(data) if rows is None else len(rows)
+        st.write(f"Found {total} materials")
         
-        st.write(f"Found {len(filtered_data)} materials (showing first 100)")
-        
-        if not filtered_data.empty:
-            for _, row in filtered_data.head(100).iterrows():
-                with st.expander(f"{row['Material No']} - {row.get('Description', '')} - MPN {row.get('Mfr Part No', '')}"):
-                    cols = st.columns(2)
-                    for i, (key, value) in enumerate(row.items()):
-                        cols[i%2].write(f"**{key}:** {value}")
-                    
-                    if st.button(f"View Details for {row['Material No']}", key=f"btn_{row['Material No']}"):
-                        st.session_state.selected_material = row['Material No']
-                        st.session_state.show_details = True
-                        st.rerun()
+        if total:
+            # Only the visible page of rows is materialized and sent to the browser
+            col1, col2 = st.columns([1, 3])
+            page_size = col1.selectbox("Rows per page", PAGE_SIZES, index=1)
+            pages = -(-total // page_size)
+            view_key = f"{search_term}|{sorted(selections.items())}|{page_size}"
+            page = col2.number_input("Page", min_value=1, max_value=pages, value=1, step=1, key=f"page_{view_key}")
+            start = (page - 1) * page_size
+            st.caption(f"Showing {start + 1}-{min(start + page_size, total)} of {total} (page {page} of {pages})")
+            page_data = data.iloc[start:start + page_size] if rows is None else data.iloc[rows[start:start + page_size]]
+            
+            event = st.dataframe(
+                page_data,
+                hide_index=True,
+                use_container_width=True,
+                on_select="rerun",
+                selection_mode="single-row",
+                key=f"results_{view_key}_{page}"
+            )
+            
+            selected = event.selection.rows
+            selected_material = page_data['Material No'].iloc[selected[0]] if selected else None
+            label = f"View Details for {selected_material}" if selected_material else "Select a row to view details"
+            if st.button(label, disabled=selected_material is None):
+                st.session_state.selected_material = selected_material
+                st.session_state.show_details = True
+                st.rerun()
             
         else:
             st.warning("No materials match your search criteria")
\ No newline at end of file
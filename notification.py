@@ -1,12 +1,40 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
+from data import load_alert_scanner
+from notification_store import get_writer, read_events
 
 # Notification Page (unchanged from your original)
 def notification_page():
     st.title("📊 Notifications")
 
+    # Catalogue-wide scan: no need to open each material first
+    st.subheader("Stock Alerts")
+    horizon = st.number_input("Reorder horizon (days)", min_value=0, max_value=1825, value=90, step=30)
+    alerts = load_alert_scanner().scan(horizon_days=horizon)
 
-    st.write("Under Development !!!")
\ No newline at end of file
+    col1, col2 = st.columns(2)
+    col1.metric("Below Buffer Stock", int(alerts['below_buffer'].sum()))
+    col2.metric(f"Reorder Due Within {horizon} Days", int(alerts['reorder_due'].sum()))
+
+    if alerts.empty:
+        st.success("All materials are above buffer stock with no reorder due")
+    else:
+        st.dataframe(alerts, hide_index=True, use_container_width=True)
+
+    st.divider()
+    st.subheader("Notification Log")
+
+    # Make sure alerts buffered by this process are visible before reading
+    get_writer().flush()
+
+    material_id = st.text_input("Filter by Material ID")
+    events = pd.DataFrame(
+        read_events(material_id=material_id.strip() or None),
+        columns=['Date', 'Material ID', 'Present Stock', 'Safety Stock']
+    )
+
+    if events.empty:
+        st.info("No notifications recorded")
+    else:
+        st.write(f"Showing {len(events)} most recent notifications")
+        st.dataframe(events, hide_index=True, use_container_width=True)
@@ -0,0 +1,187 @@
+import atexit
+import csv
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+DB_PATH = "files/notifications.db"
+LEGACY_CSV = "files/notification.csv"
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# One alert per (material, safety stock threshold) inside this window
+DEDUP_WINDOW = timedelta(hours=24)
+BATCH_SIZE = 50
+FLUSH_INTERVAL = 5.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS notifications (
+    id INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    material_id TEXT NOT NULL,
+    present_stock REAL,
+    safety_stock REAL
+);
+CREATE INDEX IF NOT EXISTS idx_notifications_material ON notifications (material_id, safety_stock, created_at);
+CREATE INDEX IF NOT EXISTS idx_notifications_created ON notifications (created_at);
+"""
+
+# Insert unless the same material/threshold was already recorded inside the window
+INSERT_DEDUP = """
+INSERT INTO notifications (created_at, material_id, present_stock, safety_stock)
+SELECT ?, ?, ?, ?
+WHERE NOT EXISTS (
+    SELECT 1 FROM notifications
+    WHERE material_id = ? AND safety_stock = ? AND created_at > ?
+)
+"""
+
+
+def connect(db_path=DB_PATH):
+    conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def _insert_events(conn, events, window):
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        inserted = 0
+        for created_at, material_id, present_stock, safety_stock in events:
+            cutoff = (datetime.strptime(created_at, TIME_FORMAT) - window).strftime(TIME_FORMAT)
+            cur = conn.execute(INSERT_DEDUP, (created_at, material_id, present_stock, safety_stock, material_id, safety_stock, cutoff))
+            inserted += cur.rowcount
+        conn.execute("COMMIT")
+        return inserted
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+# Create the store; a fresh store takes over the rows of the old append-only CSV
+def init_store(db_path=DB_PATH, legacy_csv=LEGACY_CSV, window=DEDUP_WINDOW):
+    fresh = not os.path.exists(db_path)
+    conn = connect(db_path)
+    conn.executescript(SCHEMA)
+    if fresh and legacy_csv and os.path.exists(legacy_csv):
+        with open(legacy_csv, newline='') as f:
+            rows = [(r['Date'], r['Material ID'], float(r['Present Stock']), float(r['Safety Stock'])) for r in csv.DictReader(f)]
+        _insert_events(conn, sorted(rows), window)
+    return conn
+
+
+_prepared = set()
+_prepared_lock = threading.Lock()
+
+
+# init_store once per database in this process (again only if the file was removed);
+# later readers and writers just connect
+def prepare_store(db_path=DB_PATH, legacy_csv=LEGACY_CSV, window=DEDUP_WINDOW):
+    path = os.path.abspath(db_path)
+    with _prepared_lock:
+        if path not in _prepared or not os.path.exists(path):
+            init_store(db_path, legacy_csv, window).close()
+            _prepared.add(path)
+
+
+# Buffers alerts in memory and writes them to SQLite in deduplicated batches: when
+# batch_size alerts are queued, every flush_interval seconds (daemon thread) and at exit.
+# One writer is shared by every session in the process; SQLite WAL + BEGIN IMMEDIATE
+# keeps concurrent processes from interleaving partial writes.
+class NotificationWriter:
+    def __init__(self, db_path=DB_PATH, window=DEDUP_WINDOW, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.db_path = db_path
+        self.window = window
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._recent = {}
+        self._lock = threading.Lock()
+        self._flusher = None
+        prepare_store(db_path, window=window)
+        atexit.register(self.flush)
+
+    # Queue an alert; returns False if the same material/threshold was raised inside the window
+    def notify(self, material_id, present_stock, safety_stock, when=None):
+        when = when or datetime.now()
+        key = (str(material_id), float(safety_stock))
+        with self._lock:
+            last = self._recent.get(key)
+            if last is not None and when - last < self.window:
+                return False
+            self._recent[key] = when
+            self._buffer.append((when.strftime(TIME_FORMAT), key[0], float(present_stock), key[1]))
+            due = len(self._buffer) >= self.batch_size
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop, name="notification-flush", daemon=True)
+                self._flusher.start()
+        if due:
+            self.flush()
+        return True
+
+    # Background flush so a lone alert reaches SQLite within flush_interval seconds;
+    # a failed write is retried on the next tick
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except sqlite3.Error:
+                pass
+
+    # Write buffered alerts; returns how many rows were actually inserted.
+    # On a failed write the alerts go back to the front of the buffer.
+    def flush(self):
+        with self._lock:
+            events, self._buffer = self._buffer, []
+            cutoff = datetime.now() - self.window
+            self._recent = {k: v for k, v in self._recent.items() if v > cutoff}
+        if not events:
+            return 0
+        try:
+            conn = connect(self.db_path)
+            try:
+                return _insert_events(conn, events, self.window)
+            finally:
+                conn.close()
+        except Exception:
+            with self._lock:
+                self._buffer[:0] = events
+            raise
+
+
+# Most recent alerts, optionally for one material and/or since a given time
+def read_events(material_id=None, since=None, limit=500, db_path=DB_PATH):
+    query = "SELECT created_at, material_id, present_stock, safety_stock FROM notifications"
+    clauses, params = [], []
+    if material_id:
+        clauses.append("material_id = ?")
+        params.append(str(material_id))
+    if since:
+        clauses.append("created_at >= ?")
+        params.append(since.strftime(TIME_FORMAT))
+    if clauses:
+        query += " WHERE " + " AND ".join(clauses)
+    query += " ORDER BY created_at DESC LIMIT ?"
+    params.append(limit)
+    prepare_store(db_path)
+    conn = connect(db_path)
+    try:
+        return conn.execute(query, params).fetchall()
+    finally:
+        conn.close()
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+# Process-wide writer shared by all Streamlit sessions
+def get_writer():
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = NotificationWriter()
+        return _writer
@@ -0,0 +1,131 @@
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+
+# Opt-in: INVOPTIMA_PROFILE=1 in the environment or ?profile=1 in the URL
+PROFILE_ENV = "INVOPTIMA_PROFILE"
+# When set, every profiled rerun is written here as a Chrome trace-event JSON file
+TRACE_DIR_ENV = "INVOPTIMA_TRACE_DIR"
+
+_current = contextvars.ContextVar('profiling_trace', default=None)
+# Span names whose function sits behind a Streamlit cache (see cache_miss)
+_cached_names = set()
+
+
+# Spans and cache counters collected during one script rerun
+class Trace:
+    def __init__(self, label):
+        self.label = label
+        self.started = time.perf_counter()
+        self.wall_started = datetime.now()
+        self.spans = []
+        self.calls = defaultdict(int)
+        self.misses = defaultdict(int)
+        self._depth = 0
+
+    def cache_stats(self):
+        return [
+            {'name': name, 'calls': calls, 'hits': calls - self.misses.get(name, 0), 'misses': self.misses.get(name, 0)}
+            for name, calls in self.calls.items() if name in _cached_names
+        ]
+
+    def span_rows(self):
+        return [
+            {'span': '  ' * depth + name, 'start_ms': round(start * 1000, 1), 'duration_ms': round(duration * 1000, 1)}
+            for name, start, duration, depth in sorted(self.spans, key=lambda s: s[1])
+        ]
+
+    # Chrome trace-event format; open in chrome://tracing or Perfetto
+    def to_trace_events(self):
+        tid = threading.get_ident()
+        return {
+            'label': self.label,
+            'started': self.wall_started.isoformat(timespec='milliseconds'),
+            'cache': self.cache_stats(),
+            'traceEvents': [
+                {'name': name, 'ph': 'X', 'ts': start * 1e6, 'dur': duration * 1e6, 'pid': os.getpid(), 'tid': tid}
+                for name, start, duration, _ in self.spans
+            ],
+        }
+
+
+def is_enabled(query_params=None):
+    if os.environ.get(PROFILE_ENV, '') not in ('', '0'):
+        return True
+    return bool(query_params) and query_params.get('profile') == '1'
+
+
+def current_trace():
+    return _current.get()
+
+
+def start_trace(label):
+    trace = Trace(label)
+    _current.set(trace)
+    return trace
+
+
+# Finish the rerun's trace and write it to TRACE_DIR if configured; returns the file path
+def end_trace():
+    trace = _current.get()
+    _current.set(None)
+    trace_dir = os.environ.get(TRACE_DIR_ENV)
+    if trace is None or not trace_dir:
+        return None
+    os.makedirs(trace_dir, exist_ok=True)
+    name = f"{trace.wall_started:%Y%m%d-%H%M%S-%f}-{trace.label.replace(' ', '_')}.json"
+    path = os.path.join(trace_dir, name)
+    with open(path, 'w') as f:
+        json.dump(trace.to_trace_events(), f)
+    return path
+
+
+@contextmanager
+def span(name):
+    trace = _current.get()
+    if trace is None:
+        yield
+        return
+    start = time.perf_counter()
+    trace._depth += 1
+    try:
+        yield
+    finally:
+        trace._depth -= 1
+        trace.spans.append((name, start - trace.started, time.perf_counter() - start, trace._depth))
+
+
+# Decorator: record a span for every call and count it towards `name`'s cache stats
+def timed(name):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            trace = _current.get()
+            if trace is None:
+                return func(*args, **kwargs)
+            trace.calls[name] += 1
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# Decorator placed under a Streamlit cache decorator: the body only runs on a cache miss
+def cache_miss(name):
+    _cached_names.add(name)
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            trace = _current.get()
+            if trace is not None:
+                trace.misses[name] += 1
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
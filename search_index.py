@@ -0,0 +1,145 @@
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+SEARCH_FIELDS = ['Material No', 'Description', 'Mfr Part No']
+
+# Tokens are runs of [0-9a-z] in the lower-cased text; every other byte separates tokens.
+# A byte-for-byte table keeps string offsets intact, so Arrow buffers can be translated in place.
+_SEPARATORS = bytes(b if chr(b).isascii() and (chr(b).isdigit() or chr(b).islower()) else 32 for b in range(256))
+
+# Lower rank = better match. PHRASE is a whole-token hit for one-word queries and the
+# full phrase for multi-word ones; TOKENS means every word appears somewhere in the value.
+EXACT, PREFIX, PHRASE, TOKENS, SUBSTRING = range(5)
+NO_MATCH = 255
+
+
+def _normalize(series):
+    return pc.utf8_lower(pa.array(series.to_numpy(dtype=object), type=pa.string(), from_pandas=True).fill_null(''))
+
+
+def _split_tokens(text):
+    return [t for t in text.encode().translate(_SEPARATORS).decode().split(' ') if t]
+
+
+# (token, row) pairs for every token in a string array
+def _tokenize(values):
+    _, offsets, data = values.buffers()
+    separated = pa.StringArray.from_buffers(len(values), offsets, pa.py_buffer(data.to_pybytes().translate(_SEPARATORS)), offset=values.offset)
+    lists = pc.split_pattern(separated, ' ')
+    tokens = pc.list_flatten(lists)
+    rows = pc.list_parent_indices(lists).to_numpy()
+    keep = pc.not_equal(tokens, '')
+    return tokens.filter(keep), rows[keep.to_numpy(zero_copy_only=False)]
+
+
+# Searchable state for one column: sorted values for prefix lookups and a token vocabulary
+# with per-token row postings, so substring search scans the vocabulary instead of every row.
+class _FieldIndex:
+    def __init__(self, values):
+        self.values = values
+        self.order = pc.array_sort_indices(values).to_numpy()
+        self.sorted = values.take(self.order).to_numpy(zero_copy_only=False)
+
+        tokens, rows = _tokenize(values)
+        encoded = pc.dictionary_encode(tokens)
+        token_ids = encoded.indices.to_numpy()
+        by_token = np.argsort(token_ids, kind='stable')
+        self.vocab = encoded.dictionary
+        self.token_ids = {t: i for i, t in enumerate(self.vocab.to_pylist())}
+        self.posting_rows = rows[by_token]
+        self.posting_bounds = np.searchsorted(token_ids[by_token], np.arange(len(self.vocab) + 1))
+
+    def _postings(self, token_id):
+        return self.posting_rows[self.posting_bounds[token_id]:self.posting_bounds[token_id + 1]]
+
+    # Concatenated postings of several tokens without a Python-level loop
+    def _gather(self, token_ids):
+        starts = self.posting_bounds[token_ids]
+        lengths = self.posting_bounds[token_ids + 1] - starts
+        positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        return self.posting_rows[positions]
+
+    # Rows whose value starts with `term`, and which of those equal it
+    def prefix(self, term):
+        lo = np.searchsorted(self.sorted, term, side='left')
+        hi = np.searchsorted(self.sorted, term + '\U0010ffff', side='left')
+        return self.order[lo:hi], self.sorted[lo:hi] == term
+
+    # Boolean row mask with the rows in `rows` set
+    def _mask(self, rows):
+        mask = np.zeros(len(self.values), dtype=bool)
+        mask[rows] = True
+        return mask
+
+    # Rows containing every term as a whole token
+    def tokens(self, terms):
+        token_ids = [self.token_ids.get(term) for term in terms]
+        if None in token_ids:
+            return np.empty(0, dtype=np.int64)
+        if len(token_ids) == 1:
+            return self._postings(token_ids[0])
+        mask = self._mask(self._postings(token_ids[0]))
+        for token_id in token_ids[1:]:
+            mask &= self._mask(self._postings(token_id))
+        return np.flatnonzero(mask)
+
+    # Row mask of the tokens equal to `term` (whole), starting with it, ending with it, or containing it
+    def _token_mask(self, term, whole_start, whole_end):
+        if whole_start and whole_end:
+            token_id = self.token_ids.get(term)
+            return self._mask(self._postings(token_id) if token_id is not None else [])
+        if whole_start:
+            matched = pc.starts_with(self.vocab, term)
+        elif whole_end:
+            matched = pc.ends_with(self.vocab, term)
+        else:
+            matched = pc.match_substring(self.vocab, term)
+        return self._mask(self._gather(np.flatnonzero(matched.to_numpy(zero_copy_only=False))))
+
+    # Rows containing `term` anywhere. Single-token terms only scan the vocabulary. Longer
+    # terms are verified on the rows that have all of their tokens: inner tokens as whole
+    # tokens, the first one as a token ending and the last one as a token start.
+    def substring(self, term, terms):
+        if terms == [term]:
+            return np.flatnonzero(self._token_mask(term, False, False))
+        if not terms:
+            rows = np.arange(len(self.values))
+        else:
+            separated = term.encode().translate(_SEPARATORS)
+            mask = None
+            for i, token in enumerate(terms):
+                whole_start = i > 0 or separated[:1] == b' '
+                whole_end = i < len(terms) - 1 or separated[-1:] == b' '
+                found = self._token_mask(token, whole_start, whole_end)
+                mask = found if mask is None else mask & found
+            rows = np.flatnonzero(mask)
+        found = pc.match_substring(self.values.take(rows), term).to_numpy(zero_copy_only=False)
+        return rows[found]
+
+
+# Prefix/substring/token index over the searchable master columns.
+# Built once per data load; searching never copies the frame, it only returns row positions.
+class SearchIndex:
+    def __init__(self, data, fields=SEARCH_FIELDS):
+        self.size = len(data)
+        self.fields = {f: _FieldIndex(_normalize(data[f])) for f in fields if f in data.columns}
+
+    # Ranked row positions for `query`: exact > prefix > token > substring, ties in file order
+    def search(self, query):
+        term = str(query).strip().lower()
+        if not term:
+            return np.arange(self.size)
+        terms = _split_tokens(term)
+        single_token = terms == [term]
+        ranks = np.full(self.size, NO_MATCH, dtype=np.uint8)
+        for index in self.fields.values():
+            rows = index.substring(term, terms)
+            ranks[rows] = np.minimum(ranks[rows], SUBSTRING if single_token else PHRASE)
+            if terms:
+                rows = index.tokens(terms)
+                ranks[rows] = np.minimum(ranks[rows], PHRASE if single_token else TOKENS)
+            rows, exact = index.prefix(term)
+            ranks[rows] = np.minimum(ranks[rows], np.where(exact, EXACT, PREFIX))
+        hits = np.flatnonzero(ranks != NO_MATCH)
+        return hits[np.argsort(ranks[hits], kind='stable')]
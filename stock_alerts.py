@@ -0,0 +1,48 @@
+import os
+import threading
+from datetime import date
+
+from forecasting import FORECAST_FILE, LEADTIME_FILE, load_columnar, read_material_csv
+from forecasting.plan_store import STORE_FILE, replan
+
+GROUP_KEYS = ['Material No', 'oem']
+ALERT_COLUMNS = ['Material No', 'oem', 'Desc', 'present_stock', 'buffer_stock', 'reorder_point', 'days_to_reorder', 'reorder_qty', 'below_buffer', 'reorder_due']
+
+
+# Catalogue-wide below-buffer / upcoming-reorder scan.
+# The plan is kept between calls and rebuilt when an input file changes or the day
+# rolls over; the plan store only re-simulates materials whose input rows changed.
+class AlertScanner:
+    def __init__(self, source=FORECAST_FILE, leadtime_source=LEADTIME_FILE, store_path=STORE_FILE):
+        self.source = source
+        self.leadtime_source = leadtime_source
+        self.store_path = store_path
+        self._lock = threading.Lock()
+        self._fingerprint = None
+        self._day = None
+        self._plan = None
+
+    def _refresh(self, today):
+        fingerprint = tuple((s.st_mtime_ns, s.st_size) for s in map(os.stat, (self.source, self.leadtime_source)))
+        if fingerprint == self._fingerprint and today == self._day:
+            return
+        table = load_columnar(self.source, read_material_csv)
+        leadtime = load_columnar(self.leadtime_source, read_material_csv)
+        plan, _ = replan(table, leadtime, start_date=today, store_path=self.store_path)
+        # Current-year stock position for each material
+        stock = table[table['year'] == today.year].drop_duplicates(GROUP_KEYS)[GROUP_KEYS + ['present_stock', 'buffer_stock']]
+        self._plan = plan.merge(stock, on=GROUP_KEYS, how='left')
+        self._fingerprint, self._day = fingerprint, today
+
+    # Materials below buffer stock now, or due to reorder within `horizon_days`
+    def scan(self, horizon_days=90, today=None):
+        today = today or date.today()
+        with self._lock:
+            self._refresh(today)
+            plan = self._plan
+        alerts = plan.copy()
+        alerts['days_to_reorder'] = [(d - today).days for d in alerts['reorder_point']]
+        alerts['below_buffer'] = alerts['present_stock'] < alerts['buffer_stock']
+        alerts['reorder_due'] = alerts['days_to_reorder'] <= horizon_days
+        alerts = alerts[alerts['below_buffer'] | alerts['reorder_due']]
+        return alerts.sort_values(['below_buffer', 'days_to_reorder'], ascending=[False, True])[ALERT_COLUMNS].reset_index(drop=True)
@@ -0,0 +1,146 @@
+import os
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from forecasting.engine import DAYWISE_COLUMNS, make_daywise_forecast, simulate_daywise
+from forecasting.planner import plan_reorders
+
+FORECAST_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "files", "forecasted.csv")
+START = date(2025, 1, 1)
+
+
+# The row-by-row simulation that material_details.py used before the NumPy engine, kept
+# verbatim except that the start date is a parameter instead of date.today()
+def makedaywiseForecast(df_yearly,mat,oem,end_date=None,initial_stock=10,start_date=START):
+    end_date = end_date or start_date+timedelta(days=365*5)
+    daywiseForecast = pd.DataFrame(columns=['Material No','Desc','leadtime','date','daily_cons','anticipated_consum','buffer_stock','present_stock','stock_after'])
+    df=df_yearly.copy()
+    df=df[(df['Material No']==mat)&(df['oem']==oem)].reset_index(drop=True)
+    consider_pre_order = False
+    days = (end_date-start_date).days
+    initial_stock = df.at[0,'cons_wip']*2
+    daywiseForecast.at[0,'present_stock'] = initial_stock if df.at[0,'buffer_stock'] < initial_stock else df.at[0,'buffer_stock']*1.2
+    daywiseForecast.at[0,'stock_after']=daywiseForecast.at[0,'present_stock']
+    reorder_point=end_date+timedelta(days=2)
+    reorder_qty,updated_reorder_qty=0,0
+    first_reorder=False
+    leadtime = df['leadtime'].iloc[0]
+    arrival={}
+    for i in range(days):
+        daywiseForecast.at[i,'date']=start_date+timedelta(days=i)
+        daywiseForecast.at[i,'anticipated_consum']=df.loc[df['year']==start_date.year,'cons_woip'].iloc[0]*leadtime/365
+        daywiseForecast.at[i,'buffer_stock']=df.loc[df['year']==start_date.year,'buffer_stock'].iloc[0]
+        daywiseForecast.at[i,'daily_cons']=df.loc[df['year']==start_date.year,'cons_wip'].iloc[0]/365
+        if i>0:
+            if i in arrival.keys():
+                arrived_qty = arrival[i]
+            else:
+                arrived_qty=0
+            daywiseForecast.at[i,'present_stock']=max(daywiseForecast.at[i-1,'present_stock']-daywiseForecast.at[i-1,'daily_cons'],0)
+            daywiseForecast.at[i,'stock_after']=max(daywiseForecast.at[i-1,'stock_after']-daywiseForecast.at[i-1,'daily_cons'],0)+arrived_qty
+            if not first_reorder:
+                if daywiseForecast.at[i,'present_stock']< daywiseForecast.at[i,'buffer_stock']:
+                    reorder_point = daywiseForecast.at[i,'date']
+                    first_reorder = True
+                    current_year=daywiseForecast.at[i,'date'].year
+                    reorder_qty = df.loc[df['year']==start_date.year,'cons_wip'].iloc[0] + daywiseForecast.at[i,'anticipated_consum'] +  daywiseForecast.at[i,'buffer_stock'] - daywiseForecast.at[i, 'present_stock']
+                    arrival[i+leadtime]=reorder_qty
+    daywiseForecast['Material No']=mat
+    daywiseForecast['Desc']=df.at[0,'Desc']
+    daywiseForecast['leadtime']=df['leadtime'].iloc[0]
+    date_for_stock_check = reorder_point+timedelta(days=(365+int(leadtime)))
+    if date_for_stock_check < end_date:
+        if daywiseForecast[daywiseForecast['date']==date_for_stock_check]['present_stock'].iloc[0] == 0:
+            consider_pre_order = True
+            updated_period = daywiseForecast[daywiseForecast['date'].between(start_date,reorder_point)]
+            updated_reorder_qty = reorder_qty - updated_period['daily_cons'].values.sum()
+    return daywiseForecast.reset_index(drop=True),{
+        'reorder_point':reorder_point,
+        'reorder_qty': np.ceil(reorder_qty),
+        'updated_reorder_qty':np.ceil(updated_reorder_qty),
+        'consider_pre_order':consider_pre_order,
+        'leadtime':leadtime
+    }
+
+
+def load_forecast():
+    forecasted = pd.read_csv(FORECAST_CSV)
+    forecasted['Material No'] = forecasted['Material No'].astype(str)
+    return forecasted
+
+
+def synthetic(cons_wip, buffer_stock, leadtime, cons_woip=None):
+    return pd.DataFrame({
+        'Material No': ['1'] * 6,
+        'Desc': ['SYNTHETIC'] * 6,
+        'oem': ['atlas'] * 6,
+        'leadtime': [leadtime] * 6,
+        'year': list(range(START.year, START.year + 6)),
+        'cons_wip': [cons_wip] * 6,
+        'cons_woip': [cons_woip if cons_woip is not None else cons_wip] * 6,
+        'buffer_stock': [buffer_stock] * 6,
+    })
+
+
+def assert_parity(df_yearly, mat, end_date=None):
+    expected, expected_plan = makedaywiseForecast(df_yearly, mat, 'atlas', end_date=end_date)
+    actual, plan = make_daywise_forecast(df_yearly, mat, 'atlas', end_date=end_date, start_date=START)
+    assert list(actual.columns) == DAYWISE_COLUMNS
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False, check_exact=True)
+    assert plan == expected_plan
+    return plan
+
+
+FORECAST = load_forecast()
+ATLAS_MATERIALS = sorted(FORECAST.loc[FORECAST['oem'] == 'atlas', 'Material No'].unique())
+
+
+@pytest.mark.parametrize('mat', ATLAS_MATERIALS)
+def test_atlas_materials_match_reference(mat):
+    assert_parity(FORECAST, mat)
+
+
+def test_no_reorder_inside_horizon():
+    plan = assert_parity(synthetic(cons_wip=365, buffer_stock=10, leadtime=30), '1', end_date=START + timedelta(days=90))
+    assert plan['reorder_point'] == START + timedelta(days=92)
+    assert plan['reorder_qty'] == 0
+
+
+def test_zero_leadtime():
+    plan = assert_parity(synthetic(cons_wip=365, buffer_stock=200, leadtime=0), '1')
+    assert plan['reorder_point'] < START + timedelta(days=365 * 5)
+
+
+def test_pre_order_check_in_range():
+    plan = assert_parity(synthetic(cons_wip=365, buffer_stock=20, leadtime=60), '1')
+    assert plan['consider_pre_order']
+    assert plan['updated_reorder_qty'] < plan['reorder_qty']
+
+
+# plan_reorders simulates every (Material No, oem) group at once; each of its rows
+# must make the same decisions as the single-material engine
+def assert_planner_parity(df_yearly, start_date):
+    plan = plan_reorders(df_yearly, start_date=start_date)
+    groups = df_yearly.groupby(['Material No', 'oem'], sort=False, dropna=False)
+    assert len(plan) == groups.ngroups
+    for row in plan.itertuples(index=False):
+        rows = groups.get_group((row[0], row[1]))
+        _, expected = simulate_daywise(rows, row[0], start_date, start_date + timedelta(days=365 * 5))
+        assert (row.reorder_point, row.reorder_qty, row.updated_reorder_qty, row.consider_pre_order, row.leadtime) == (
+            expected['reorder_point'], expected['reorder_qty'], expected['updated_reorder_qty'], expected['consider_pre_order'], expected['leadtime'],
+        ), (row[0], row[1])
+
+
+@pytest.mark.parametrize('start_date', [START, date(2026, 7, 15), date(2028, 3, 1)])
+def test_planner_matches_engine_for_every_group(start_date):
+    assert_planner_parity(FORECAST, start_date)
+
+
+def test_planner_matches_engine_on_edge_cases():
+    cases = [synthetic(cons_wip=365, buffer_stock=10, leadtime=30, cons_woip=200), synthetic(cons_wip=365, buffer_stock=200, leadtime=0),
+             synthetic(cons_wip=365, buffer_stock=20, leadtime=60), synthetic(cons_wip=0, buffer_stock=5, leadtime=30)]
+    fleet = pd.concat([case.assign(**{'Material No': str(i)}) for i, case in enumerate(cases)], ignore_index=True)
+    assert_planner_parity(fleet, START)
@@ -0,0 +1,60 @@
+import csv
+from datetime import datetime, timedelta
+
+import pytest
+
+from notification_store import NotificationWriter, init_store, read_events
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    # The default legacy CSV path is relative; keep the repository's file out of these stores
+    monkeypatch.chdir(tmp_path)
+    return str(tmp_path / "notifications.db")
+
+
+def test_same_material_and_threshold_is_deduplicated_within_window(db_path):
+    writer = NotificationWriter(db_path=db_path, flush_interval=3600)
+    now = datetime(2025, 7, 1, 9, 0, 0)
+    assert writer.notify('100', 3, 10, when=now)
+    assert not writer.notify('100', 2, 10, when=now + timedelta(hours=1))
+    assert writer.notify('100', 2, 12, when=now + timedelta(hours=1))
+    assert writer.notify('200', 1, 10, when=now + timedelta(hours=2))
+    assert writer.notify('100', 1, 10, when=now + timedelta(hours=25))
+    assert writer.flush() == 4
+    assert sorted(read_events(db_path=db_path)) == [
+        ('2025-07-01 09:00:00', '100', 3.0, 10.0),
+        ('2025-07-01 10:00:00', '100', 2.0, 12.0),
+        ('2025-07-01 11:00:00', '200', 1.0, 10.0),
+        ('2025-07-02 10:00:00', '100', 1.0, 10.0),
+    ]
+
+
+# Writers in different processes only share the database; the insert itself deduplicates
+def test_database_deduplicates_across_writers(db_path):
+    now = datetime(2025, 7, 1, 9, 0, 0)
+    first, second = NotificationWriter(db_path=db_path), NotificationWriter(db_path=db_path)
+    first.notify('100', 3, 10, when=now)
+    second.notify('100', 2, 10, when=now + timedelta(minutes=5))
+    assert first.flush() == 1
+    assert second.flush() == 0
+    assert read_events(db_path=db_path) == [('2025-07-01 09:00:00', '100', 3.0, 10.0)]
+
+
+def test_fresh_store_imports_legacy_csv(db_path, tmp_path):
+    legacy = tmp_path / "notification.csv"
+    with open(legacy, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Date', 'Material ID', 'Present Stock', 'Safety Stock'])
+        writer.writerow(['2025-07-01 09:00:00', '100', '3', '10'])
+        writer.writerow(['2025-07-01 12:00:00', '100', '2', '10'])
+        writer.writerow(['2025-07-03 09:00:00', '100', '1', '10'])
+        writer.writerow(['2025-07-01 10:00:00', '200', '5', '8'])
+    init_store(db_path, legacy_csv=str(legacy)).close()
+    # An existing store does not import the CSV again
+    init_store(db_path, legacy_csv=str(legacy)).close()
+    assert read_events(db_path=db_path) == [
+        ('2025-07-03 09:00:00', '100', 1.0, 10.0),
+        ('2025-07-01 10:00:00', '200', 5.0, 8.0),
+        ('2025-07-01 09:00:00', '100', 3.0, 10.0),
+    ]
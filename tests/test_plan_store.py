@@ -0,0 +1,74 @@
+import os
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from forecasting.plan_store import GROUP_KEYS, input_hashes, replan
+from forecasting.planner import plan_reorders
+
+FILES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "files")
+START = date(2025, 1, 1)
+
+
+@pytest.fixture(scope='module')
+def forecast():
+    return pd.read_csv(os.path.join(FILES, "forecasted.csv"), dtype={'Material No': str})
+
+
+@pytest.fixture(scope='module')
+def leadtime():
+    return pd.read_csv(os.path.join(FILES, "leadtime.csv"), dtype={'Material No': str})
+
+
+def by_group(plan):
+    return plan.sort_values(GROUP_KEYS, na_position='first').reset_index(drop=True)
+
+
+def test_cold_and_warm_store_match_plan_reorders(forecast, leadtime, tmp_path):
+    store = str(tmp_path / "plans.parquet")
+    expected = by_group(plan_reorders(forecast, start_date=START))
+
+    cold, counts = replan(forecast, leadtime, start_date=START, store_path=store)
+    assert counts == {'reused': 0, 'recomputed': len(expected), 'skipped': 0}
+    pd.testing.assert_frame_equal(by_group(cold), expected, check_dtype=False)
+
+    warm, counts = replan(forecast, leadtime, start_date=START, store_path=store)
+    assert counts == {'reused': len(expected), 'recomputed': 0, 'skipped': 0}
+    pd.testing.assert_frame_equal(by_group(warm), expected, check_dtype=False)
+
+
+# A full run includes materials without a leadtime row; a subset may or may not. Both
+# must hash like the full run (a left merge once rounded the hashes through float64
+# whenever any material in the run lacked a leadtime row).
+@pytest.mark.parametrize('with_missing_leadtime', [False, True])
+def test_subset_hashes_match_full_run(forecast, leadtime, tmp_path, with_missing_leadtime):
+    has_leadtime = forecast['Material No'].isin(leadtime['Material No'])
+    assert not has_leadtime.all()
+    subset_materials = list(forecast.loc[has_leadtime, 'Material No'].drop_duplicates().iloc[:20])
+    if with_missing_leadtime:
+        subset_materials += list(forecast.loc[~has_leadtime, 'Material No'].unique()[:2])
+    subset = forecast[forecast['Material No'].isin(subset_materials)]
+
+    full = input_hashes(forecast, leadtime, START.year)
+    partial = input_hashes(subset, leadtime, START.year)
+    expected = full[full['Material No'].isin(subset_materials)].reset_index(drop=True)
+    pd.testing.assert_frame_equal(partial.reset_index(drop=True), expected)
+
+    store = str(tmp_path / "plans.parquet")
+    replan(forecast, leadtime, start_date=START, store_path=store)
+    _, counts = replan(subset, leadtime, start_date=START, store_path=store)
+    assert counts == {'reused': len(expected), 'recomputed': 0, 'skipped': 0}
+
+
+def test_changed_leadtime_resimulates_only_that_material(forecast, leadtime, tmp_path):
+    store = str(tmp_path / "plans.parquet")
+    replan(forecast, leadtime, start_date=START, store_path=store)
+
+    material = forecast['Material No'].iloc[0]
+    changed = leadtime.copy()
+    changed.loc[changed['Material No'] == material, 'pogr_forecasted'] += 30
+    groups = forecast[GROUP_KEYS].drop_duplicates()
+    _, counts = replan(forecast, changed, start_date=START, store_path=store)
+    assert counts['recomputed'] == (groups['Material No'] == material).sum() == 1
+    assert counts['reused'] == len(groups) - 1
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from forecasting.reliability import add_reliability_demand, reliability_at, yearly_failure_demand
+
+RELIABILITY = pd.DataFrame({
+    'Material No': ['1', '1', '2', '3', '4'],
+    'Material Description': ['PUMP', 'PUMP', 'VALVE', 'SEAL', 'GAUGE'],
+    'Equipment': ['A', 'B', 'A', 'A', 'A'],
+    'K Factor': [2.0, 2.0, 1.0, 1.5, np.nan],
+    'MTBR': [1000.0, 1000.0, 500.0, 0.0, 800.0],
+})
+POPULATION = pd.DataFrame({'Material No': ['1', '2', '3', '4'], 'Population': [10, 4, 5, 5]})
+
+
+def test_first_year_matches_365_day_reliability():
+    demand = yearly_failure_demand(RELIABILITY, POPULATION, 2025, 2027)
+    first = demand[demand['year'] == 2025].set_index('Material No')['reliability_demand']
+    assert first['1'] == (1 - reliability_at(1000.0, 2.0, 365)) * 10
+    assert first['2'] == (1 - reliability_at(500.0, 1.0, 365)) * 4
+
+
+def test_rising_failure_rate_raises_later_years():
+    demand = yearly_failure_demand(RELIABILITY, POPULATION, 2025, 2027).set_index(['Material No', 'year'])['reliability_demand']
+    assert demand['1', 2025] < demand['1', 2026] < demand['1', 2027]
+    # K = 1 is a constant failure rate: the same demand every year
+    np.testing.assert_allclose([demand['2', 2026], demand['2', 2027]], demand['2', 2025])
+
+
+def test_unusable_reliability_rows_add_nothing():
+    yearly = pd.DataFrame({
+        'Material No': ['1', '1', '3', '4', '5'],
+        'year': [2025, 2026, 2025, 2025, 2025],
+        'cons_wip': [10.0, 10.0, 7.0, 8.0, 9.0],
+        'cons_woip': [9.0, 9.0, 6.0, 7.0, 8.0],
+    })
+    planned = add_reliability_demand(yearly, RELIABILITY, POPULATION)
+    assert not planned[['cons_wip', 'cons_woip', 'reliability_demand']].isna().any().any()
+    assert planned['reliability_demand'].tolist()[2:] == [0.0, 0.0, 0.0]
+    assert (planned['cons_wip'] - yearly['cons_wip']).tolist() == planned['reliability_demand'].tolist()
@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+
+from forecasting.stock_value import parse_amount
+
+AMOUNTS = ['7,25,92,853.32', '-12,752,107.86', '0.00', '-654021.22', None]
+EXPECTED = [72592853.32, -12752107.86, 0.0, -654021.22, np.nan]
+
+
+def test_clean_column_parses_in_arrow():
+    parsed = parse_amount(pd.Series(AMOUNTS, dtype='str'))
+    np.testing.assert_array_equal(parsed.to_numpy(), EXPECTED)
+
+
+# One stray cell sends the whole column through the regex fallback; signs must survive it
+def test_stray_character_keeps_negative_amounts():
+    parsed = parse_amount(pd.Series(AMOUNTS + ['Rs 1,000.50'], dtype='str'))
+    np.testing.assert_array_equal(parsed.to_numpy(), EXPECTED + [1000.5])
+
+
+def test_numeric_column_passes_through():
+    parsed = parse_amount(pd.Series([1, -2, 3]))
+    np.testing.assert_array_equal(parsed.to_numpy(), [1.0, -2.0, 3.0])